@@ -9,8 +9,12 @@ import sys
 import os
 import re
 import threading
-import csv
-from datetime import datetime
+import collections
+import functools
+import queue
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtWidgets import QMainWindow, QApplication, QFileDialog, QMessageBox
 
@@ -20,29 +24,74 @@ from main import (
     OCRConfig,
     parse_timestamp,
     TIMESTAMP_PATTERNS,
+    OCR_WORKERS,
 )
 
 # Import UI class
 from ui_batch import Ui_BatchExtractWindow
 
-# Add a new timestamp pattern for the rangetime.txt format (YYYYMMDD_hhmmss.SSS)
-RANGETIME_PATTERN = (re.compile(r"(\d{8}_\d{6}\.\d{3})"), "%Y%m%d_%H%M%S.%f")
+# Regex for finding rangetime.txt timestamps (YYYYMMDD_hhmmss.SSS) in free text.
+# convert_rangetime_timestamp does not use it, since CSV fields are already delimited.
+RANGETIME_REGEX = re.compile(r"(\d{8}_\d{6}\.\d{3})")
 
+# Margin added before the start and after the end of each extracted segment
+SEGMENT_BUFFER = timedelta(minutes=1)
+
+# Interval for applying buffered progress and log updates to the UI (~30 Hz)
+UI_FLUSH_INTERVAL_MS = 33
+
+# Maximum number of lines kept in the status log
+STATUS_LOG_MAX_LINES = 500
+
+# Maximum number of discovered segments waiting to be submitted for extraction
+DISCOVERY_QUEUE_SIZE = 64
+
+# Cores each extraction keeps busy outside OCR: video decoding and ffmpeg
+SEGMENT_CORES = 2
+
+# Number of segments extracted at once. OCR runs on the shared OCR_WORKERS
+# pool, so the remaining cores are split between extractions, up to four.
+SEGMENT_WORKERS = max(1, min(4, ((os.cpu_count() or 1) - OCR_WORKERS) // SEGMENT_CORES))
+
+# Cache of rangetime.txt discovery results, keyed by parent directory. Each entry
+# holds the mtimes of every directory that was scanned, so repeated batch runs can
+# skip the rescan as long as no directory has changed.
+_RANGETIME_FILES_CACHE = {}
+
+# Cache of parsed rangetime.txt files, keyed by path and validated by file mtime
+_RANGETIME_SEGMENTS_CACHE = {}
+
+@functools.lru_cache(maxsize=None)
 def convert_rangetime_timestamp(timestamp_str):
     """
     Convert a timestamp from YYYYMMDD_hhmmss.SSS format to a datetime object.
 
+    Results are memoized, since the same timestamps tend to recur across rows
+    and rangetime.txt files.
+
     Args:
         timestamp_str: Timestamp string in YYYYMMDD_hhmmss.SSS format
 
     Returns:
         datetime object or None if conversion fails
     """
+    # The format is a fixed 19-character layout, so slice the fields directly
+    # instead of going through datetime.strptime
+    s = timestamp_str
+    if len(s) != 19 or s[8] != "_" or s[15] != ".":
+        return None
+    digits = s[0:8] + s[9:15] + s[16:19]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+
     try:
-        # Parse the timestamp using the rangetime pattern
-        dt = datetime.strptime(timestamp_str, RANGETIME_PATTERN[1])
-        return dt
+        return datetime(
+            int(s[0:4]), int(s[4:6]), int(s[6:8]),
+            int(s[9:11]), int(s[11:13]), int(s[13:15]),
+            int(s[16:19]) * 1000,
+        )
     except ValueError:
+        # Out-of-range field (e.g. month 13)
         return None
 
 def process_rangetime_file(rangetime_path, video_path, callback=None):
@@ -63,15 +112,25 @@ def process_rangetime_file(rangetime_path, video_path, callback=None):
     # Get the directory containing the rangetime.txt file
     output_dir = os.path.dirname(rangetime_path)
 
+    # Reuse the previous parse if the file hasn't changed since
+    try:
+        mtime = os.stat(rangetime_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    cached = _RANGETIME_SEGMENTS_CACHE.get(rangetime_path)
+    if mtime is not None and cached is not None and cached[0] == mtime:
+        return list(cached[1])
+
     # Read the rangetime.txt file
     segments = []
     try:
         with open(rangetime_path, 'r') as f:
-            reader = csv.reader(f)
             # Skip header row
-            next(reader, None)
+            next(f, None)
 
-            for row in reader:
+            # The file is a plain two-column CSV without quoting, so a split is enough
+            for line in f:
+                row = line.split(',', 2)
                 if len(row) >= 2:
                     start_str = row[0].strip()
                     end_str = row[1].strip()
@@ -81,22 +140,134 @@ def process_rangetime_file(rangetime_path, video_path, callback=None):
                     end_time = convert_rangetime_timestamp(end_str)
 
                     if start_time and end_time:
-                        # Define output path
-                        output_path = os.path.join(output_dir, "video.avi")
+                        # Define output path; the first segment keeps the plain
+                        # video.avi name, later ones are numbered so that they
+                        # don't overwrite each other
+                        if segments:
+                            output_name = f"video_{len(segments) + 1}.avi"
+                        else:
+                            output_name = "video.avi"
+                        output_path = os.path.join(output_dir, output_name)
                         segments.append((start_time, end_time, output_path))
                     else:
                         if callback:
                             callback(0, f"Error: Invalid timestamp format in {rangetime_path}")
+
+        _RANGETIME_SEGMENTS_CACHE[rangetime_path] = (mtime, list(segments))
     except Exception as e:
         if callback:
             callback(0, f"Error reading {rangetime_path}: {str(e)}")
 
     return segments
 
+def _directories_unchanged(dir_mtimes):
+    """
+    Check whether none of the given directories has been modified.
+
+    Args:
+        dir_mtimes: Dictionary mapping directory paths to their recorded mtimes
+
+    Returns:
+        True if every directory still exists with the recorded mtime
+    """
+    for path, mtime in dir_mtimes.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+def _scan_rangetime_files(directory, dir_mtimes):
+    """
+    Recursively yield rangetime.txt files using os.scandir.
+
+    DirEntry objects carry the file type from the directory listing, which saves
+    the extra stat calls os.walk makes for every entry.
+
+    Args:
+        directory: Directory to scan
+        dir_mtimes: Dictionary that receives the mtime of every subdirectory scanned
+
+    Yields:
+        Paths to rangetime.txt files
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            subdirs.append(entry)
+        elif entry.name.lower() == "rangetime.txt":
+            yield entry.path
+
+    for entry in subdirs:
+        try:
+            dir_mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+        except OSError:
+            continue
+        yield from _scan_rangetime_files(entry.path, dir_mtimes)
+
+def iter_rangetime_files(parent_dir):
+    """
+    Yield all rangetime.txt files below a parent directory as they are found.
+
+    Results are cached per parent directory. Adding or removing an entry changes
+    the mtime of the containing directory, so the cache is reused only while all
+    scanned directories keep their recorded mtimes.
+
+    Args:
+        parent_dir: Path to the parent directory containing subfolders with rangetime.txt files
+
+    Yields:
+        Paths to rangetime.txt files
+    """
+    cached = _RANGETIME_FILES_CACHE.get(parent_dir)
+    if cached is not None and _directories_unchanged(cached[0]):
+        yield from cached[1]
+        return
+
+    rangetime_files = []
+    dir_mtimes = {}
+    try:
+        dir_mtimes[parent_dir] = os.stat(parent_dir).st_mtime_ns
+    except OSError:
+        return
+
+    for rangetime_path in _scan_rangetime_files(parent_dir, dir_mtimes):
+        rangetime_files.append(rangetime_path)
+        yield rangetime_path
+
+    _RANGETIME_FILES_CACHE[parent_dir] = (dir_mtimes, rangetime_files)
+
+def find_rangetime_files(parent_dir):
+    """
+    Find all rangetime.txt files below a parent directory.
+
+    Args:
+        parent_dir: Path to the parent directory containing subfolders with rangetime.txt files
+
+    Returns:
+        List of paths to rangetime.txt files
+    """
+    return list(iter_rangetime_files(parent_dir))
+
 def extract_batch_segments(video_path, parent_dir, callback=None):
     """
     Extract video segments for all subfolders in the parent directory.
 
+    Discovery runs in a separate thread and feeds segments through a bounded
+    queue, so extraction of the first segments starts while the rest of the
+    directory tree is still being scanned.
+
     Args:
         video_path: Path to the video file
         parent_dir: Path to the parent directory containing subfolders with rangetime.txt files
@@ -108,71 +279,174 @@ def extract_batch_segments(video_path, parent_dir, callback=None):
     if callback:
         callback(0, f"Scanning {parent_dir} for rangetime.txt files")
 
-    # Find all rangetime.txt files in subfolders
-    rangetime_files = []
-    for root, dirs, files in os.walk(parent_dir):
-        for file in files:
-            if file.lower() == "rangetime.txt":
-                rangetime_files.append(os.path.join(root, file))
+    # Per-segment progress, so overall progress can be reported while segments
+    # are extracted concurrently. The total grows as segments are discovered.
+    progress_lock = threading.Lock()
+    segment_progress = []
+    progress_total = 0
+    overall_progress = 0
+    processed_segments = 0
 
-    if not rangetime_files:
-        if callback:
-            callback(0, "No rangetime.txt files found")
-        return 0
+    def report_segment_progress(i, progress, status_text):
+        nonlocal progress_total, overall_progress
+        if not callback:
+            return
+        with progress_lock:
+            progress_total += progress - segment_progress[i]
+            segment_progress[i] = progress
+            total_segments = len(segment_progress)
+            overall_progress = int(progress_total / total_segments)
+            current_progress = overall_progress
+        callback(current_progress, f"Segment {i+1}/{total_segments}: {status_text}")
+
+    def report_status(status_text):
+        # Messages outside a segment keep the last overall progress, so the bar
+        # doesn't jump back while other segments are being extracted
+        if not callback:
+            return
+        with progress_lock:
+            current_progress = overall_progress
+        callback(current_progress, status_text)
 
-    if callback:
-        callback(0, f"Found {len(rangetime_files)} rangetime.txt files")
+    def discovery_callback(progress, status_text):
+        report_status(status_text)
 
-    # Process each rangetime.txt file
-    total_segments = 0
-    processed_segments = 0
+    # Segments found by the discovery thread, terminated by None
+    discovery_queue = queue.Queue(maxsize=DISCOVERY_QUEUE_SIZE)
+    rangetime_file_count = 0
 
-    # First, collect all segments to process
-    all_segments = []
-    for rangetime_path in rangetime_files:
-        segments = process_rangetime_file(rangetime_path, video_path, callback)
-        all_segments.extend(segments)
-        total_segments += len(segments)
+    def discover_segments():
+        nonlocal rangetime_file_count
+        try:
+            # Find all rangetime.txt files in subfolders and read their segments
+            for rangetime_path in iter_rangetime_files(parent_dir):
+                rangetime_file_count += 1
+                for segment in process_rangetime_file(rangetime_path, video_path, discovery_callback):
+                    discovery_queue.put(segment)
+        except Exception as e:
+            report_status(f"Error scanning {parent_dir}: {str(e)}")
+        finally:
+            discovery_queue.put(None)
 
-    if total_segments == 0:
-        if callback:
-            callback(0, "No valid segments found in rangetime.txt files")
-        return 0
+    discovery_thread = threading.Thread(target=discover_segments)
+    discovery_thread.daemon = True
+    discovery_thread.start()
 
     # Create OCR config
     ocr_config = OCRConfig()
 
-    # Process each segment
-    for i, (start_time, end_time, output_path) in enumerate(all_segments):
-        if callback:
-            progress = int(i * 100 / total_segments)
-            callback(progress, f"Processing segment {i+1}/{total_segments}")
+    def extract_segment(i, start_time, end_time, output_path):
+        # Create a callback function that updates progress for this segment
+        def segment_callback(progress, status_text):
+            report_segment_progress(i, progress, status_text)
+
+        # Add buffer: subtract 1 minute from start time and add 1 minute to end time
+        buffered_start_time = start_time - SEGMENT_BUFFER
+        buffered_end_time = end_time + SEGMENT_BUFFER
+
+        # Extract the segment with buffered timestamps
+        extract_snippet(video_path, buffered_start_time, buffered_end_time, output_path, segment_callback, ocr_config)
+
+    # Process segments concurrently as they are discovered; decoding and OCR
+    # happen outside the GIL
+    with ThreadPoolExecutor(max_workers=SEGMENT_WORKERS) as executor:
+        futures = {}
+        # Index of the segment extracting each (start_time, end_time) range, and
+        # extra output paths that receive a copy of that segment's output
+        unique_ranges = {}
+        duplicate_outputs = {}
+        while True:
+            segment = discovery_queue.get()
+            if segment is None:
+                break
+
+            start_time, end_time, output_path = segment
+
+            # Identical ranges are extracted once and copied to the other folders
+            if (start_time, end_time) in unique_ranges:
+                i = unique_ranges[(start_time, end_time)]
+                duplicate_outputs[i].append(output_path)
+                report_status(f"Segment {i+1} will also be copied to {output_path}")
+                continue
+
+            with progress_lock:
+                i = len(segment_progress)
+                segment_progress.append(0)
+            report_status(f"Queued segment {i+1}")
+            unique_ranges[(start_time, end_time)] = i
+            duplicate_outputs[i] = []
+            futures[executor.submit(extract_segment, i, start_time, end_time, output_path)] = (i, output_path)
+
+        if rangetime_file_count == 0:
+            report_status("No rangetime.txt files found")
+        elif not futures:
+            report_status("No valid segments found in rangetime.txt files")
+        else:
+            report_status(f"Found {len(futures)} unique segments in {rangetime_file_count} rangetime.txt files")
 
-        try:
-            # Create a callback function that updates progress for this segment
-            def segment_callback(segment_progress, status_text):
-                if callback:
-                    # Scale the progress to the overall progress
-                    overall_progress = int(((i * 100) + segment_progress) / total_segments)
-                    callback(overall_progress, f"Segment {i+1}/{total_segments}: {status_text}")
+        for future in as_completed(futures):
+            i, output_path = futures[future]
+            try:
+                future.result()
+                processed_segments += 1
+                report_segment_progress(i, 100, "Completed")
+            except Exception as e:
+                report_segment_progress(i, 100, f"Error: {str(e)}")
+                continue
 
-            # Add buffer: subtract 1 minute from start time and add 1 minute to end time
-            from datetime import timedelta
-            buffered_start_time = start_time - timedelta(minutes=1)
-            buffered_end_time = end_time + timedelta(minutes=1)
+            for duplicate_path in duplicate_outputs[i]:
+                try:
+                    shutil.copyfile(output_path, duplicate_path)
+                    processed_segments += 1
+                    report_segment_progress(i, 100, f"Copied to {duplicate_path}")
+                except OSError as e:
+                    report_segment_progress(i, 100, f"Error copying to {duplicate_path}: {str(e)}")
 
-            # Extract the segment with buffered timestamps
-            extract_snippet(video_path, buffered_start_time, buffered_end_time, output_path, segment_callback, ocr_config)
-            processed_segments += 1
+    return processed_segments
 
-            if callback:
-                callback(int((i+1) * 100 / total_segments), f"Completed segment {i+1}/{total_segments}")
+class ExtractionWorkerSignals(QtCore.QObject):
+    """Signals emitted by ExtractionWorker.
 
-        except Exception as e:
-            if callback:
-                callback(int((i+1) * 100 / total_segments), f"Error processing segment {i+1}/{total_segments}: {str(e)}")
+    QRunnable is not a QObject, so the signals live on this sidecar object.
+    """
 
-    return processed_segments
+    # Number of processed segments
+    succeeded = QtCore.pyqtSignal(int)
+    # Error message
+    failed = QtCore.pyqtSignal(str)
+    # Emitted after succeeded or failed
+    finished = QtCore.pyqtSignal()
+
+class ExtractionWorker(QtCore.QRunnable):
+    """Runs a batch extraction on a QThreadPool thread."""
+
+    def __init__(self, video_path, parent_dir, callback=None):
+        """Initialize the worker.
+
+        Args:
+            video_path: Path to the video file
+            parent_dir: Path to the parent directory containing subfolders with rangetime.txt files
+            callback: Optional callback function for progress updates
+        """
+        super().__init__()
+        self.video_path = video_path
+        self.parent_dir = parent_dir
+        self.callback = callback
+        self.signals = ExtractionWorkerSignals()
+
+    def run(self):
+        """Run the extraction and report the outcome through the signals."""
+        try:
+            processed_segments = extract_batch_segments(
+                self.video_path,
+                self.parent_dir,
+                self.callback
+            )
+            self.signals.succeeded.emit(processed_segments)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            self.signals.finished.emit()
 
 class BatchExtractWindow(QMainWindow):
     """Main window for the batch extract application."""
@@ -192,6 +466,18 @@ class BatchExtractWindow(QMainWindow):
         self.parent_dir = None
         self.processing = False
         self.progress_timer = None
+        self._pulse_stopped = True
+        self.worker = None
+
+        # Progress and log updates from the worker thread are buffered here and
+        # flushed to the UI at a fixed rate. The lock keeps a progress value that
+        # arrives during a flush from being dropped.
+        self._pending_progress = None
+        self._pending_progress_lock = threading.Lock()
+        self._pending_logs = collections.deque()
+        self.ui_flush_timer = QtCore.QTimer(self)
+        self.ui_flush_timer.setInterval(UI_FLUSH_INTERVAL_MS)
+        self.ui_flush_timer.timeout.connect(self._flush_ui_updates)
 
         # Connect signals to slots
         self.stop_pulse_signal.connect(self._stop_progress_pulse_slot)
@@ -204,6 +490,9 @@ class BatchExtractWindow(QMainWindow):
         self.ui.progress_bar.setValue(0)
         self.ui.status_label.setText("Ready")
 
+        # Keep only the most recent lines so appends stay cheap on long runs
+        self.ui.status_text.document().setMaximumBlockCount(STATUS_LOG_MAX_LINES)
+
         # Initialize status text area with instructions
         self.ui.status_text.clear()
         self.log_status("Welcome to VidExtract Batch Extract")
@@ -266,83 +555,36 @@ class BatchExtractWindow(QMainWindow):
         # Start progress bar pulsing animation
         self.start_progress_pulse()
 
-        # Run extraction in a separate thread to keep UI responsive
-        def extraction_thread():
-            try:
-                processed_segments = extract_batch_segments(
-                    self.video_path,
-                    self.parent_dir,
-                    self.update_progress
-                )
-
-                # Show success message on the main thread
-                QtCore.QMetaObject.invokeMethod(
-                    self, 
-                    "show_success_message", 
-                    QtCore.Qt.ConnectionType.QueuedConnection,
-                    QtCore.Q_ARG(int, processed_segments)
-                )
+        # Start applying buffered progress updates
+        self.ui_flush_timer.start()
 
-            except Exception as e:
-                # Show error message on the main thread
-                QtCore.QMetaObject.invokeMethod(
-                    self, 
-                    "show_error_message", 
-                    QtCore.Qt.ConnectionType.QueuedConnection,
-                    QtCore.Q_ARG(str, str(e))
-                )
-
-            finally:
-                # Re-enable UI elements on the main thread
-                QtCore.QMetaObject.invokeMethod(
-                    self, 
-                    "reset_ui", 
-                    QtCore.Qt.ConnectionType.QueuedConnection
-                )
-
-        # Start extraction thread
-        thread = threading.Thread(target=extraction_thread)
-        thread.daemon = True
-        thread.start()
+        # Run extraction on the global thread pool to keep UI responsive
+        self.worker = ExtractionWorker(self.video_path, self.parent_dir, self.update_progress)
+        self.worker.signals.succeeded.connect(self.show_success_message)
+        self.worker.signals.failed.connect(self.show_error_message)
+        self.worker.signals.finished.connect(self.reset_ui)
+        QtCore.QThreadPool.globalInstance().start(self.worker)
 
     def update_progress(self, progress, status_text):
         """Update the progress bar and status label.
 
-        Args:
-            progress: Progress value (0-100)
-            status_text: Status text to display
-        """
-        # Stop pulsing if we're getting actual progress updates
-        # Use signal to stop the timer in the main thread
-        self.stop_pulse_signal.emit()
-
-        # Update UI in the main thread using invokeMethod if called from another thread
-        if QtCore.QThread.currentThread() != self.thread():
-            QtCore.QMetaObject.invokeMethod(
-                self,
-                "_update_progress_main_thread",
-                QtCore.Qt.ConnectionType.QueuedConnection,
-                QtCore.Q_ARG(int, progress),
-                QtCore.Q_ARG(str, status_text)
-            )
-        else:
-            self._update_progress_main_thread(progress, status_text)
-
-    @QtCore.pyqtSlot(int, str)
-    def _update_progress_main_thread(self, progress, status_text):
-        """Update the progress bar and status label in the main thread.
+        Updates are buffered and applied by the UI flush timer, so worker threads
+        never post to the event loop directly.
 
         Args:
             progress: Progress value (0-100)
             status_text: Status text to display
         """
-        self.ui.progress_bar.setValue(progress)
-        self.ui.status_label.setText(status_text)
-
-        # Log the status message to the text area
-        self.log_status(status_text)
+        # Stop pulsing once actual progress updates arrive
+        # Use signal to stop the timer in the main thread, but only emit it once
+        if not self._pulse_stopped:
+            self._pulse_stopped = True
+            self.stop_pulse_signal.emit()
 
-        QApplication.processEvents()  # Force update of the UI
+        # Only the most recent progress value is shown, but every message is logged
+        with self._pending_progress_lock:
+            self._pending_progress = (progress, status_text)
+        self._pending_logs.append(self._format_log_line(status_text))
 
     def log_status(self, message):
         """Append a status message to the status text edit with timestamp.
@@ -350,33 +592,43 @@ class BatchExtractWindow(QMainWindow):
         Args:
             message: Status message to append
         """
-        # Update UI in the main thread using invokeMethod if called from another thread
-        if QtCore.QThread.currentThread() != self.thread():
-            QtCore.QMetaObject.invokeMethod(
-                self,
-                "_log_status_main_thread",
-                QtCore.Qt.ConnectionType.QueuedConnection,
-                QtCore.Q_ARG(str, message)
-            )
-        else:
-            self._log_status_main_thread(message)
+        self._pending_logs.append(self._format_log_line(message))
 
-    @QtCore.pyqtSlot(str)
-    def _log_status_main_thread(self, message):
-        """Append a status message to the status text edit with timestamp in the main thread.
+        # Flush right away on the main thread; otherwise the UI flush timer picks it up
+        if QtCore.QThread.currentThread() == self.thread():
+            self._flush_ui_updates()
+
+    def _format_log_line(self, message):
+        """Prefix a status message with the current time.
 
         Args:
-            message: Status message to append
+            message: Status message to format
+
+        Returns:
+            Formatted log line
         """
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.ui.status_text.append(f"[{timestamp}] {message}")
-
-        # Scroll to the bottom
-        self.ui.status_text.verticalScrollBar().setValue(
-            self.ui.status_text.verticalScrollBar().maximum()
-        )
+        return f"[{timestamp}] {message}"
 
-        QApplication.processEvents()  # Force update of the UI
+    @QtCore.pyqtSlot()
+    def _flush_ui_updates(self):
+        """Apply buffered progress and log updates in the main thread."""
+        with self._pending_progress_lock:
+            pending_progress, self._pending_progress = self._pending_progress, None
+        if pending_progress is not None:
+            progress, status_text = pending_progress
+            self.ui.progress_bar.setValue(progress)
+            self.ui.status_label.setText(status_text)
+
+        lines = []
+        while self._pending_logs:
+            lines.append(self._pending_logs.popleft())
+        if lines:
+            # One append per flush instead of one per message
+            self.ui.status_text.append("\n".join(lines))
+
+            # Scroll to the bottom without forcing a relayout of the whole document
+            self.ui.status_text.moveCursor(QtGui.QTextCursor.MoveOperation.End)
 
     def clear_status_log(self):
         """Clear the status text edit."""
@@ -393,12 +645,13 @@ class BatchExtractWindow(QMainWindow):
     @QtCore.pyqtSlot()
     def _clear_status_log_main_thread(self):
         """Clear the status text edit in the main thread."""
+        self._pending_logs.clear()
         self.ui.status_text.clear()
-        QApplication.processEvents()  # Force update of the UI
 
     def start_progress_pulse(self):
         """Start the progress bar pulsing animation."""
         if self.progress_timer is None:
+            self._pulse_stopped = False
             self.progress_timer = QtCore.QTimer(self)
             self.progress_timer.timeout.connect(self._update_pulse)
             self.progress_timer.start(100)  # Update every 100ms
@@ -450,6 +703,11 @@ class BatchExtractWindow(QMainWindow):
         self.ui.select_file_button.setEnabled(True)
         self.ui.select_dir_button.setEnabled(True)
         self.stop_progress_pulse()
+
+        # Apply any remaining buffered updates
+        self.ui_flush_timer.stop()
+        self._flush_ui_updates()
+
         self.ui.progress_bar.setValue(100)
         self.ui.status_label.setText("Ready")
 
@@ -1,15 +1,38 @@
 import sys
 import cv2
+import numpy as np
 import pytesseract
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import threading
+import time
 import math
+import functools
+import hashlib
+import shutil
+import subprocess
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtWidgets import QMainWindow, QApplication, QFileDialog, QMessageBox
 from ui import Ui_MainWindow
 
+# Tesseract's OpenMP threading is slower than a single thread on images as
+# small as the timestamp overlay, and oversubscribes the CPU when several
+# images are recognized in parallel. This has to be set before tesserocr loads
+# libtesseract; pytesseract's subprocesses inherit it.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+# tesserocr keeps the Tesseract engine loaded between calls, avoiding the
+# subprocess launch and model load that pytesseract pays for every image.
+# It is optional; pytesseract is used when it isn't installed.
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 # Uncomment and modify the line below to set a custom path to Tesseract OCR executable
 # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'  # Windows example
 # pytesseract.pytesseract.tesseract_cmd = r'/usr/local/bin/tesseract'  # macOS/Linux example
@@ -60,6 +83,522 @@ TIMESTAMP_PATTERNS = [
     (re.compile(r"(\d{2}:\d{2}:\d{2}\.\d{3})"), "%H:%M:%S.%f"),
 ]
 
+# Character positions of (year, month, day, hour, minute, second, millisecond)
+# in matches of the fixed-width default formats, so that they can be parsed
+# without strptime. Formats not listed here are parsed with strptime.
+FIXED_WIDTH_FORMATS = {
+    "%m/%d/%Y %H:%M:%S:%f": (slice(6, 10), slice(0, 2), slice(3, 5), slice(11, 13), slice(14, 16), slice(17, 19), slice(20, 23)),
+    "%d/%m/%Y %H:%M:%S:%f": (slice(6, 10), slice(3, 5), slice(0, 2), slice(11, 13), slice(14, 16), slice(17, 19), slice(20, 23)),
+    "%Y-%m-%d %H:%M:%S.%f": (slice(0, 4), slice(5, 7), slice(8, 10), slice(11, 13), slice(14, 16), slice(17, 19), slice(20, 23)),
+    "%H:%M:%S:%f": (None, None, None, slice(0, 2), slice(3, 5), slice(6, 8), slice(9, 12)),
+    "%H:%M:%S.%f": (None, None, None, slice(0, 2), slice(3, 5), slice(6, 8), slice(9, 12)),
+}
+
+# Maximum number of frames to step forward with grab() before seeking instead.
+# A seek decodes from the previous keyframe anyway, so short forward jumps are
+# cheaper as sequential grabs.
+MAX_GRAB_SKIP = 60
+
+# Maximum number of estimate-and-read steps used to bracket a target timestamp
+# before falling back to sampling the video frame by frame.
+MAX_REFINEMENT_STEPS = 8
+
+# Codecs tried in order for re-encoded output. H.264 gives smaller files and is
+# often hardware accelerated, but many OpenCV builds can't encode it, so XVID
+# is kept as the fallback.
+OUTPUT_FOURCCS = ('avc1', 'H264', 'XVID')
+
+# First codec in OUTPUT_FOURCCS that could be opened, per output file extension
+_output_fourcc_cache = {}
+
+# FFmpeg is used to cut the output snippet without re-encoding when it is on
+# PATH; otherwise the frames are re-encoded with OpenCV.
+FFMPEG_PATH = shutil.which("ffmpeg")
+
+
+def open_video_capture(video_path):
+    """Open a video file, preferring hardware-accelerated decoding.
+
+    Uses the FFmpeg backend with any available hardware decoder (VAAPI, DXVA2,
+    VideoToolbox, NVDEC...). OpenCV silently decodes in software when no
+    hardware decoder is available, and the default backend is tried if FFmpeg
+    cannot open the file at all.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        cv2.VideoCapture object (check isOpened() before use)
+    """
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [
+        cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+    ])
+    if not cap.isOpened():
+        cap.release()
+        cap = cv2.VideoCapture(video_path)
+    # Frames are read on demand, so don't let the backend decode ahead
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
+
+def copy_video_segment(video_path, output_path, start_frame, end_frame, fps):
+    """Cut a segment out of a video with an FFmpeg stream copy.
+
+    The packets are copied as-is, so no frame is decoded or re-encoded. The cut
+    snaps to the keyframe at or before start_frame.
+
+    Args:
+        video_path: Path to the source video
+        output_path: Path to save the output video
+        start_frame: First frame of the segment
+        end_frame: Frame to stop at, or None to copy until the end of the video
+        fps: Frame rate of the source video
+
+    Returns:
+        True if the segment was written, False if FFmpeg is unavailable or failed
+    """
+    if not FFMPEG_PATH or fps <= 0:
+        return False
+
+    command = [FFMPEG_PATH, '-y', '-v', 'error',
+               '-ss', f"{start_frame / fps:.3f}", '-i', video_path]
+    if end_frame is not None:
+        command += ['-t', f"{(end_frame - start_frame) / fps:.3f}"]
+    command += ['-c', 'copy', output_path]
+
+    try:
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return False
+    return result.returncode == 0 and os.path.isfile(output_path)
+
+
+def open_video_writer(output_path, fps, frame_size):
+    """Open a video writer with the first codec in OUTPUT_FOURCCS that is available.
+
+    Args:
+        output_path: Path to save the output video
+        fps: Frame rate of the output video
+        frame_size: Tuple of (width, height)
+
+    Returns:
+        cv2.VideoWriter object, or None if no codec could be opened
+    """
+    extension = os.path.splitext(output_path)[1].lower()
+    cached = _output_fourcc_cache.get(extension)
+    for fourcc in ([cached] if cached else OUTPUT_FOURCCS):
+        out = cv2.VideoWriter(output_path, cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*fourcc), fps, frame_size)
+        if not out.isOpened():
+            # Fall back to the default backend
+            out = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*fourcc), fps, frame_size)
+        if out.isOpened():
+            _output_fourcc_cache[extension] = fourcc
+            return out
+        out.release()
+    return None
+
+
+def grab_frame(cap, frame_num):
+    """Move the video capture to a frame and grab it without decoding it to BGR.
+
+    Short forward jumps are done with sequential grab() calls; backward or long
+    jumps fall back to seeking. Call cap.retrieve() afterwards to get the image.
+
+    Args:
+        cap: Video capture object
+        frame_num: Frame number to grab
+
+    Returns:
+        True if the frame was grabbed, False otherwise
+    """
+    position = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+    skip = frame_num - position
+    if 0 <= skip <= MAX_GRAB_SKIP:
+        for _ in range(skip):
+            if not cap.grab():
+                return False
+    else:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
+    return cap.grab()
+
+# Characters that can appear in any of the timestamp patterns. Restricting
+# Tesseract to them shrinks the recognizer's search at every step. The space
+# has to be included, otherwise the gap between date and time is dropped and
+# the date patterns no longer match.
+TESSERACT_WHITELIST = '0123456789 :/.-'
+
+# pytesseract splits the config with shlex, which only honours quotes outside
+# Windows. There the space is left out; the time-only pattern still matches.
+if sys.platform == 'win32':
+    _TESSERACT_CLI_WHITELIST = TESSERACT_WHITELIST.replace(' ', '')
+else:
+    _TESSERACT_CLI_WHITELIST = f'"{TESSERACT_WHITELIST}"'
+
+# Tesseract options for the single-line timestamp overlay (pytesseract),
+# using only the LSTM engine
+TESSERACT_CONFIG = f'--psm 7 --oem 1 -c tessedit_char_whitelist={_TESSERACT_CLI_WHITELIST}'
+
+# Maximum (width, height) of the frame shown in the timestamp preview
+PREVIEW_SIZE = (600, 400)
+
+# Number of threads for parallel OCR. Each Tesseract run is single-threaded
+# (see OMP_THREAD_LIMIT above); half the cores leaves room for video decoding.
+OCR_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+
+# Thread pool for parallel OCR, created on first use
+_ocr_executor = None
+_ocr_executor_lock = threading.Lock()
+
+# Idle tesserocr APIs. An API instance isn't thread-safe, so each one is used
+# by one thread at a time, but keeping them between calls means the model is
+# only loaded once for each API that is in use at the same time, rather than
+# again in every new preview or extraction thread.
+_tesserocr_apis = []
+_tesserocr_apis_lock = threading.Lock()
+_tesserocr_unavailable = tesserocr is None
+# Set once the first tesserocr API has been initialized successfully
+_tesserocr_initialized = False
+
+# Recognized text of recent regions of interest, keyed by a hash of the
+# grayscale pixels. Neighbouring frames and repeated reads of the same frame
+# often show an identical overlay, which then only has to be recognized once.
+OCR_CACHE_SIZE = 4096
+_ocr_text_cache = OrderedDict()
+_ocr_text_cache_lock = threading.Lock()
+
+
+def _acquire_tesserocr_api():
+    """Take an idle tesserocr API for the current thread, creating one if needed.
+
+    The API must be handed back with _release_tesserocr_api() after use.
+
+    Returns:
+        tesserocr.PyTessBaseAPI object, or None if tesserocr is unavailable
+    """
+    global _tesserocr_unavailable, _tesserocr_initialized
+    if _tesserocr_unavailable:
+        return None
+
+    with _tesserocr_apis_lock:
+        if _tesserocr_apis:
+            return _tesserocr_apis.pop()
+
+    try:
+        api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_LINE, oem=tesserocr.OEM.LSTM_ONLY)
+        api.SetVariable("tessedit_char_whitelist", TESSERACT_WHITELIST)
+    except RuntimeError:
+        # Language data not found; fall back to pytesseract
+        _tesserocr_unavailable = True
+        return None
+    _tesserocr_initialized = True
+    return api
+
+
+def _release_tesserocr_api(api):
+    """Return a tesserocr API taken with _acquire_tesserocr_api() to the pool.
+
+    Args:
+        api: tesserocr.PyTessBaseAPI object
+    """
+    with _tesserocr_apis_lock:
+        _tesserocr_apis.append(api)
+
+
+def _tesserocr_available():
+    """Check whether OCR runs through tesserocr rather than pytesseract.
+
+    Only the first call may initialize an API; the answer is then kept in the
+    module flags, so checking never grows the pool.
+
+    Returns:
+        True if a tesserocr API can be created
+    """
+    if _tesserocr_unavailable:
+        return False
+    if not _tesserocr_initialized:
+        api = _acquire_tesserocr_api()
+        if api is None:
+            return False
+        _release_tesserocr_api(api)
+    return True
+
+
+def ocr_image(image):
+    """Recognize the text in a single-line grayscale image.
+
+    Args:
+        image: Grayscale image (2D numpy array)
+
+    Returns:
+        Recognized text
+    """
+    api = _acquire_tesserocr_api()
+    if api is not None:
+        try:
+            image = np.ascontiguousarray(image)
+            height, width = image.shape[:2]
+            api.SetImageBytes(image.tobytes(), width, height, 1, width)
+            return api.GetUTF8Text()
+        finally:
+            _release_tesserocr_api(api)
+
+    return pytesseract.image_to_string(image, config=TESSERACT_CONFIG)
+
+
+def warm_up_ocr():
+    """Load the OCR engine ahead of the first real recognition.
+
+    Recognizes a blank image, so a tesserocr API with its model loaded is
+    waiting in the pool (or, with pytesseract, the model files are in the
+    OS cache) when the first preview or extraction starts. Errors are
+    ignored; they are reported when OCR is actually used.
+    """
+    try:
+        ocr_image(np.full((32, 128), 255, dtype=np.uint8))
+    except Exception:
+        pass
+
+
+def ocr_images(images):
+    """Recognize the text in several single-line grayscale images.
+
+    The images are recognized in parallel on up to OCR_WORKERS threads; both
+    tesserocr and the Tesseract subprocesses started by pytesseract run outside
+    the GIL. pytesseract starts a new process for every call, so each thread
+    passes its share of the images to a single Tesseract run.
+
+    Args:
+        images: List of grayscale images (2D numpy arrays)
+
+    Returns:
+        List of recognized texts, one per image
+    """
+    workers = min(OCR_WORKERS, len(images))
+    if _tesserocr_available():
+        if workers <= 1:
+            return [ocr_image(image) for image in images]
+        return list(_get_ocr_executor().map(ocr_image, images))
+
+    if len(images) <= 1:
+        return [ocr_image(image) for image in images]
+
+    # Split the images into one batch per worker
+    batch_size = math.ceil(len(images) / workers)
+    batches = [images[i:i + batch_size] for i in range(0, len(images), batch_size)]
+    if len(batches) == 1:
+        return _ocr_image_list(images)
+    return [text for texts in _get_ocr_executor().map(_ocr_image_list, batches) for text in texts]
+
+
+def _ocr_image_list(images):
+    """Recognize several single-line grayscale images in one pytesseract call.
+
+    The images are written to a temporary directory and Tesseract is given a
+    text file listing them, so it starts and loads its model once and then
+    recognizes each image as a separate page. The page texts are separated by
+    form feeds in the output.
+
+    Args:
+        images: List of grayscale images (2D numpy arrays)
+
+    Returns:
+        List of recognized texts, one per image
+    """
+    with tempfile.TemporaryDirectory(prefix="vidextract_ocr_") as temp_dir:
+        image_paths = []
+        for i, image in enumerate(images):
+            image_path = os.path.join(temp_dir, f"{i}.png")
+            cv2.imwrite(image_path, image)
+            image_paths.append(image_path)
+
+        list_path = os.path.join(temp_dir, "images.txt")
+        with open(list_path, "w") as f:
+            f.write("\n".join(image_paths) + "\n")
+
+        text = pytesseract.image_to_string(list_path, config=TESSERACT_CONFIG)
+
+    # Tesseract 4 ends every page with a form feed, Tesseract 5 only separates them
+    texts = text.split("\f")[:len(images)]
+    return texts + [""] * (len(images) - len(texts))
+
+
+def _get_ocr_executor():
+    """Get the shared thread pool used for parallel OCR.
+
+    Returns:
+        ThreadPoolExecutor with OCR_WORKERS threads
+    """
+    global _ocr_executor
+    with _ocr_executor_lock:
+        if _ocr_executor is None:
+            _ocr_executor = ThreadPoolExecutor(max_workers=OCR_WORKERS, thread_name_prefix="ocr")
+    return _ocr_executor
+
+
+def prepare_overlay(overlay, grayscale_mode="green"):
+    """Turn a BGR timestamp region into the binary image OCR is run on.
+
+    The timestamp overlay is usually high-contrast white or light text, so the
+    green channel alone is enough and avoids a weighted color conversion;
+    overlays in other colors can use the luma instead. The result is binarized
+    with Otsu's threshold, which Tesseract recognizes faster and more reliably
+    than a grayscale image, and made dark text on a light background.
+
+    Args:
+        overlay: BGR image of the timestamp region
+        grayscale_mode: "green" to use the green channel, "luma" for a full
+            grayscale conversion (default: "green", see OCRConfig.grayscale_mode)
+
+    Returns:
+        Binary image (2D numpy array)
+    """
+    if grayscale_mode == "luma":
+        gray = cv2.cvtColor(overlay, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = overlay[:, :, 1]
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    if cv2.countNonZero(binary) < binary.size // 2:
+        binary = cv2.bitwise_not(binary)
+    return binary
+
+
+def _roi_key(image):
+    """Hash the pixels of a region of interest for the OCR text cache.
+
+    Args:
+        image: Grayscale image (2D numpy array)
+
+    Returns:
+        Hash digest of the image size and pixels
+    """
+    digest = hashlib.blake2b(np.ascontiguousarray(image).tobytes(), digest_size=16)
+    digest.update(repr(image.shape).encode())
+    return digest.digest()
+
+
+def _store_ocr_texts(recognized):
+    """Add recognized texts to the OCR text cache, evicting the oldest entries.
+
+    Args:
+        recognized: Dictionary mapping _roi_key() hashes to recognized texts
+    """
+    with _ocr_text_cache_lock:
+        _ocr_text_cache.update(recognized)
+        while len(_ocr_text_cache) > OCR_CACHE_SIZE:
+            _ocr_text_cache.popitem(last=False)
+
+
+def ocr_image_cached(image):
+    """Recognize a single-line grayscale image, reusing the text of an identical one.
+
+    Args:
+        image: Grayscale image (2D numpy array)
+
+    Returns:
+        Recognized text
+    """
+    key = _roi_key(image)
+    with _ocr_text_cache_lock:
+        if key in _ocr_text_cache:
+            _ocr_text_cache.move_to_end(key)
+            return _ocr_text_cache[key]
+
+    text = ocr_image(image)
+    _store_ocr_texts({key: text})
+    return text
+
+
+def ocr_frames(cap, frame_nums, region_coords, patterns, cache, grayscale_mode="green"):
+    """Read the timestamps of several frames into the cache.
+
+    The frames are read in the given order and their regions of interest are
+    recognized together. With tesserocr on several OCR threads each region is
+    queued for recognition as soon as its frame is decoded, so decoding the
+    next frames overlaps with OCR; otherwise the regions are collected and
+    passed to ocr_images(). Frames that are already in the cache are skipped,
+    and regions identical to one recognized before reuse its text.
+
+    Args:
+        cap: Video capture object
+        frame_nums: Frame numbers to read, in increasing order
+        region_coords: Tuple of (x_start, y_start, width, height) for the timestamp region
+        patterns: List of (regex, format) tuples passed to parse_timestamp
+        cache: Dictionary mapping frame numbers to timestamps (or None)
+        grayscale_mode: Channel conversion passed to prepare_overlay (default: "green")
+
+    Returns:
+        True if all frames could be read, False if reading stopped early
+
+    Raises:
+        RuntimeError: If Tesseract OCR is not installed or not in PATH
+    """
+    x_start, y_start, region_width, region_height = region_coords
+
+    executor = None
+    if OCR_WORKERS > 1 and _tesserocr_available():
+        executor = _get_ocr_executor()
+
+    batch_frames = []
+    keys = []
+    known = {}
+    # Key -> region image waiting for ocr_images(), or future of its text
+    pending = {}
+    all_read = True
+    for frame_num in frame_nums:
+        if frame_num in cache:
+            continue
+
+        # Step forward with grab() and only decode frames that need OCR
+        ret = grab_frame(cap, frame_num)
+        if ret:
+            ret, frame = cap.retrieve()
+        if not ret:
+            all_read = False
+            break
+
+        overlay = frame[y_start:y_start+region_height, x_start:x_start+region_width]
+        gray = prepare_overlay(overlay, grayscale_mode)
+        key = _roi_key(gray)
+        batch_frames.append(frame_num)
+        keys.append(key)
+
+        # Only recognize regions that haven't been seen before, each one once
+        if key in known or key in pending:
+            continue
+        with _ocr_text_cache_lock:
+            if key in _ocr_text_cache:
+                _ocr_text_cache.move_to_end(key)
+                known[key] = _ocr_text_cache[key]
+                continue
+        pending[key] = executor.submit(ocr_image, gray) if executor else gray
+
+    if not batch_frames:
+        return all_read
+
+    try:
+        if executor:
+            recognized = {key: future.result() for key, future in pending.items()}
+        else:
+            recognized = dict(zip(pending, ocr_images(list(pending.values()))))
+    except Exception as e:
+        error_msg = str(e)
+        if "tesseract is not installed" in error_msg.lower() or "tesseract not found" in error_msg.lower():
+            raise RuntimeError(
+                "Tesseract OCR is not installed or not in your PATH. "
+                "Please install Tesseract OCR and make sure it's in your system PATH. "
+                "See the README.md file for more information."
+            )
+        # For other OCR errors, continue with no timestamps
+        recognized = {}
+    else:
+        _store_ocr_texts(recognized)
+
+    known.update(recognized)
+    for frame_num, key in zip(batch_frames, keys):
+        cache[frame_num] = parse_timestamp(known.get(key, ""), patterns)
+
+    return all_read
+
 
 def compare_timestamps_by_time(ts1, ts2):
     """Compare two timestamps by time only, ignoring the date component.
@@ -146,6 +685,58 @@ def time_diff_seconds(ts1, ts2):
 
     return abs(t1_seconds - t2_seconds)
 
+def parse_fixed_width_timestamp(value, format_str):
+    """Parse a timestamp matched by one of the default patterns.
+
+    Slices the fields out of the fixed-width string instead of going through
+    strptime. Time-only formats get strptime's default date of 1900-01-01.
+
+    Args:
+        value: Timestamp string matched by the format's regex
+        format_str: datetime format string of the pattern
+
+    Returns:
+        datetime object, or None if the format isn't a fixed-width default format
+
+    Raises:
+        ValueError: If a field is out of range
+    """
+    fields = FIXED_WIDTH_FORMATS.get(format_str)
+    if fields is None or len(value) != fields[-1].stop:
+        return None
+
+    year, month, day, hour, minute, second, millisecond = fields
+    if year is None:
+        date_parts = (1900, 1, 1)
+    else:
+        date_parts = (int(value[year]), int(value[month]), int(value[day]))
+    return datetime(*date_parts, int(value[hour]), int(value[minute]), int(value[second]),
+                    int(value[millisecond]) * 1000)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timestamp_match(value, format_str):
+    """Parse a matched timestamp string, caching recent results.
+
+    Neighbouring frames often OCR to the same text, so the same string is
+    parsed many times in a row.
+
+    Args:
+        value: Timestamp string matched by the format's regex
+        format_str: datetime format string of the pattern
+
+    Returns:
+        datetime object, or None if the string isn't a valid timestamp in this format
+    """
+    try:
+        dt = parse_fixed_width_timestamp(value, format_str)
+        if dt is None:
+            dt = datetime.strptime(value, format_str)
+        return dt
+    except ValueError:
+        return None
+
+
 def parse_timestamp(text: str, patterns=None, reference_date=None, prioritize_time=True):
     """Parse timestamp from text using multiple patterns.
 
@@ -161,28 +752,61 @@ def parse_timestamp(text: str, patterns=None, reference_date=None, prioritize_ti
     if patterns is None:
         patterns = TIMESTAMP_PATTERNS
 
-    if reference_date is None:
-        reference_date = datetime.now().date()
-
+    # Patterns that share a regex (e.g. MM/DD and DD/MM) only search the text once
+    matches = {}
     for pattern, format_str in patterns:
-        match = pattern.search(text)
+        if pattern not in matches:
+            matches[pattern] = pattern.search(text)
+        match = matches[pattern]
         if match:
-            try:
-                dt = datetime.strptime(match.group(1), format_str)
-
-                # If this is a time-only format (no date info), use the reference date
-                if format_str in ["%H:%M:%S:%f", "%H:%M:%S.%f"]:
-                    dt = datetime.combine(reference_date, dt.time())
-                # For formats with date, optionally use the time but with the reference date
-                # This ensures all timestamps are treated as being from the same day
-                elif prioritize_time:
-                    dt = datetime.combine(reference_date, dt.time())
-
-                return dt
-            except ValueError:
+            dt = _parse_timestamp_match(match.group(1), format_str)
+            if dt is None:
                 # Try next pattern if this one doesn't work
                 continue
 
+            if reference_date is None:
+                reference_date = datetime.now().date()
+
+            # If this is a time-only format (no date info), use the reference date
+            if format_str in ["%H:%M:%S:%f", "%H:%M:%S.%f"]:
+                dt = datetime.combine(reference_date, dt.time())
+            # For formats with date, optionally use the time but with the reference date
+            # This ensures all timestamps are treated as being from the same day
+            elif prioritize_time:
+                dt = datetime.combine(reference_date, dt.time())
+
+            return dt
+
+    return None
+
+
+def parse_timestamp_string(value, patterns=None):
+    """Parse a timestamp string, such as one typed by the user, in any pattern's format.
+
+    Strings matching a pattern's regex exactly go through the cached
+    fixed-width parser; others are tried with strptime, which also accepts
+    e.g. unpadded fields.
+
+    Args:
+        value: Timestamp string
+        patterns: List of (regex, format) tuples to try (default: TIMESTAMP_PATTERNS)
+
+    Returns:
+        datetime object, or None if the string doesn't match any format
+    """
+    if patterns is None:
+        patterns = TIMESTAMP_PATTERNS
+
+    for pattern, format_str in patterns:
+        if pattern.fullmatch(value):
+            dt = _parse_timestamp_match(value, format_str)
+        else:
+            try:
+                dt = datetime.strptime(value, format_str)
+            except ValueError:
+                dt = None
+        if dt is not None:
+            return dt
     return None
 
 
@@ -196,6 +820,10 @@ class OCRConfig:
     REGION_BOTTOM_LEFT = "bottom-left"
     REGION_CUSTOM = "custom"
 
+    # Ways to reduce the color region to one channel before binarizing it
+    GRAYSCALE_GREEN = "green"  # Green channel only; fast, fine for white or light text
+    GRAYSCALE_LUMA = "luma"  # Weighted grayscale conversion, for other text colors
+
     def __init__(self):
         # Default values
         self.region = self.REGION_TOP_RIGHT
@@ -206,6 +834,7 @@ class OCRConfig:
         self.custom_width = 300
         self.custom_height = 50
         self.patterns = TIMESTAMP_PATTERNS
+        self.grayscale_mode = self.GRAYSCALE_GREEN
 
     def get_region_coords(self, frame_width, frame_height):
         """Get the coordinates for the region of interest based on the current configuration.
@@ -238,7 +867,195 @@ class OCRConfig:
                     self.region_width, self.region_height)
 
 
-def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_config=None, callback=None, max_search_time=300, first_timestamp=None, first_frame=None):
+def frames_until_time(ts, target_time, fps):
+    """Estimate how many frames after the frame showing ts the target time appears.
+
+    Args:
+        ts: Timestamp read from a frame (datetime object)
+        target_time: Target timestamp (datetime object)
+        fps: Frame rate of the video
+
+    Returns:
+        Estimated frame offset, negative if the target time is earlier than ts
+    """
+    offset = time_diff_seconds(target_time, ts) * fps
+    if is_time_lt(target_time, ts):
+        offset = -offset
+    return int(round(offset))
+
+
+def read_nearest_timestamp(cap, frame_num, low, high, cache, ocr_config, region_coords, max_distance, deadline=None):
+    """Read the timestamp of the frame closest to frame_num that has a readable one.
+
+    frame_num is read first. If it has no timestamp, windows around it of
+    1, 2, 4, ... frames on each side are read, up to max_distance and within
+    low..high. Each window is read in one ocr_frames() call in increasing
+    frame order, so it costs one seek, and the readable frame closest to
+    frame_num is used. A frame whose overlay can't be recognized then doesn't
+    have to be skipped in one direction.
+
+    Args:
+        cap: Video capture object
+        frame_num: Frame to start from
+        low: First frame that may be read
+        high: Last frame that may be read
+        cache: Dictionary to cache OCR results
+        ocr_config: OCR configuration
+        region_coords: Tuple of (x_start, y_start, width, height) for the timestamp region
+        max_distance: Maximum distance from frame_num in frames
+        deadline: time.monotonic() value after which no further window is read (default: None)
+
+    Returns:
+        Tuple of (frame number, timestamp), or (None, None) if no frame within
+        max_distance has a timestamp or the deadline has passed
+
+    Raises:
+        RuntimeError: If Tesseract OCR is not installed or not in PATH
+    """
+    distance = 0
+    while True:
+        window = range(max(low, frame_num - distance), min(high, frame_num + distance) + 1)
+        ocr_frames(cap, window, region_coords, ocr_config.patterns, cache, ocr_config.grayscale_mode)
+
+        # Closest readable frame in the window, preferring later frames on a tie
+        readable = [frame for frame in window if cache.get(frame)]
+        if readable:
+            nearest = min(readable, key=lambda frame: (abs(frame - frame_num), -frame))
+            return nearest, cache[nearest]
+
+        if distance >= max_distance or (window.start == low and window.stop == high + 1):
+            return None, None
+        if deadline is not None and time.monotonic() > deadline:
+            return None, None
+        distance = min(max(1, distance * 2), max_distance)
+
+
+def refine_frame_estimate(cap, target_time, reference_frame, reference_ts, cache, ocr_config, region_coords, callback=None, max_search_time=60, frame_rate=None):
+    """Bracket the target timestamp by repeatedly estimating its frame from the last reading.
+
+    Starting from a reference frame, each step jumps to the frame where the
+    target time should appear according to the last timestamp read and the
+    video's FPS. Timestamps only increase through the video, so every reading
+    narrows the range that can contain the target. Once readings on both sides
+    of the target are known, the next frame is interpolated between them
+    instead. A frame without a readable timestamp is replaced by the nearest
+    readable one, so refining continues. When the range is down to about a
+    second of video, it is binary searched; the same happens to a wider range
+    after MAX_REFINEMENT_STEPS readings, or when no timestamp can be read
+    within a second of the estimate.
+
+    Args:
+        cap: Video capture object
+        target_time: Target timestamp to find
+        reference_frame: Frame number of a known timestamp
+        reference_ts: Timestamp read at reference_frame
+        cache: Dictionary to cache OCR results
+        ocr_config: OCR configuration
+        region_coords: Tuple of (x_start, y_start, width, height) for the timestamp region
+        callback: Optional callback function for progress updates
+        max_search_time: Maximum search time in seconds for the binary search (default: 60)
+        frame_rate: Frames per second of timestamp time (default: None, uses the video's FPS)
+
+    Returns:
+        Tuple of (frame number or None if the target couldn't be bracketed,
+        frame number from which a sampling search should continue)
+
+    Raises:
+        RuntimeError: If Tesseract OCR is not installed or not in PATH or if search times out
+    """
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = frame_rate or cap.get(cv2.CAP_PROP_FPS)
+
+    # Latest frame known to be before the target and earliest frame known to be
+    # at or after it, with their timestamps
+    before_frame = before_ts = None
+    after_frame = after_ts = None
+
+    def narrow(frame_num, ts):
+        nonlocal before_frame, before_ts, after_frame, after_ts
+        if is_time_lt(ts, target_time):
+            if before_frame is None or frame_num > before_frame:
+                before_frame, before_ts = frame_num, ts
+        else:
+            if after_frame is None or frame_num < after_frame:
+                after_frame, after_ts = frame_num, ts
+
+    # Start from every timestamp read so far, such as the first and last frames
+    for cached_frame, cached_ts in list(cache.items()):
+        if cached_ts is not None:
+            narrow(cached_frame, cached_ts)
+
+    # Size of the bracketing range at the previous step, and whether the
+    # previous reading was before the target
+    bracket_width = None
+    last_side = None
+
+    frame_num, ts = reference_frame, reference_ts
+    for step in range(MAX_REFINEMENT_STEPS):
+        narrow(frame_num, ts)
+
+        if before_frame is not None and after_frame is not None:
+            if after_frame - before_frame <= 1:
+                return after_frame, after_frame
+            if after_frame - before_frame <= fps:
+                break
+
+        # The target lies outside the video
+        if after_frame == 0:
+            return 0, 0
+        if before_frame == total_frames - 1:
+            return before_frame, before_frame
+
+        # Jump to where the target should be, staying strictly inside the known range.
+        # Once it is bracketed, interpolate between the two readings, which follows
+        # the overlay's local rate if it doesn't advance evenly through the video.
+        # Where the rate changes, interpolation can keep landing on the same side
+        # of the target, so the range is halved instead when two readings in a
+        # row fell on the same side, more than a second away, without halving it.
+        side = is_time_lt(ts, target_time)
+        bracket_time = time_diff_seconds(after_ts, before_ts)
+        if before_frame is not None and after_frame is not None and bracket_time > 0:
+            width = after_frame - before_frame
+            if (side == last_side and width > bracket_width // 2
+                    and time_diff_seconds(ts, target_time) > 1):
+                next_frame = (before_frame + after_frame) // 2
+            else:
+                offset = time_diff_seconds(target_time, before_ts) / bracket_time
+                next_frame = before_frame + round(offset * width)
+            bracket_width = width
+        else:
+            next_frame = frame_num + frames_until_time(ts, target_time, fps)
+        last_side = side
+        low = before_frame + 1 if before_frame is not None else 0
+        high = after_frame - 1 if after_frame is not None else total_frames - 1
+        next_frame = max(low, min(next_frame, high))
+
+        if callback:
+            callback(0, f"Estimated target frame {next_frame} from timestamp {ts} at frame {frame_num}")
+
+        # An unreadable frame is replaced by the nearest readable one inside the range,
+        # searched within a second of it in a few ascending reads
+        read_frame, read_ts = read_nearest_timestamp(cap, next_frame, low, high, cache, ocr_config, region_coords, max(1, round(fps)))
+        if read_frame is None:
+            if callback:
+                callback(0, f"No timestamp found near frame {next_frame}")
+            break
+        if read_frame != next_frame and callback:
+            callback(0, f"No timestamp found at frame {next_frame}, using frame {read_frame}")
+        frame_num, ts = read_frame, read_ts
+
+    if before_frame is not None and after_frame is not None:
+        if callback:
+            callback(0, f"Target time is between frames {before_frame} and {after_frame}. Performing binary search")
+        return binary_search_frames(cap, before_frame, after_frame, target_time, cache, ocr_config, callback, max_search_time), before_frame
+
+    # Continue from the closest frame known to be before the target
+    if before_frame is not None:
+        return None, before_frame
+    return None, max(0, after_frame - int(fps * 60))
+
+
+def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_config=None, callback=None, max_search_time=300, first_timestamp=None, first_frame=None, frame_rate=None, start_at=0):
     """Find the frame corresponding to the target timestamp with adaptive frame sampling and caching.
 
     This function uses an optimized search algorithm that leverages the video's FPS and a known
@@ -246,11 +1063,14 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
     significantly reduce the search time by jumping directly to a frame close to the target.
 
     The optimization works as follows:
-    1. If a first_timestamp and first_frame are provided, calculate the time difference between
-       the first_timestamp and the target_time.
-    2. Use the time difference and the video's FPS to estimate the frame difference.
-    3. Jump directly to the estimated frame and start a more focused search from there.
-    4. If no first_timestamp is provided, fall back to the traditional search method.
+    1. If no first_timestamp and first_frame are provided, the timestamp of the frame at
+       start_at is used instead.
+    2. Use the time difference to the target_time and the video's FPS to estimate the target
+       frame, read the timestamp there, and repeat from the new reading until the target is
+       bracketed closely (see refine_frame_estimate()).
+    3. Binary search the bracketing range.
+    4. If no timestamp can be read or the target can't be bracketed, fall back to the
+       traditional sampling search.
 
     Args:
         cap: Video capture object
@@ -262,6 +1082,8 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
         max_search_time: Maximum search time in seconds (default: 300)
         first_timestamp: First known timestamp in the video (default: None)
         first_frame: Frame number corresponding to first_timestamp (default: None)
+        frame_rate: Frames per second of timestamp time, if measured (default: None, uses the video's FPS)
+        start_at: Frame to start from when no first_timestamp is provided (default: 0)
 
     Returns:
         Frame number or None if not found
@@ -285,7 +1107,8 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
     height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
     # Get region coordinates based on configuration
-    x_start, y_start, region_width, region_height = ocr_config.get_region_coords(width, height)
+    region_coords = ocr_config.get_region_coords(width, height)
+    x_start, y_start, region_width, region_height = region_coords
 
     # Report region being searched
     if callback:
@@ -297,23 +1120,26 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
     last_valid_ts = None
     last_valid_frame = None
 
+    # Without a known timestamp, use the timestamp at start_at as the reference
+    if (first_timestamp is None or first_frame is None) and fps > 0:
+        ocr_frames(cap, [start_at], region_coords, ocr_config.patterns, cache, ocr_config.grayscale_mode)
+        if cache.get(start_at):
+            first_timestamp, first_frame = cache[start_at], start_at
+
     # If we have a first timestamp and frame, use them to estimate the target frame
     if first_timestamp is not None and first_frame is not None and fps > 0:
-        # Calculate time difference in seconds (using time_diff_seconds to ignore date)
-        time_diff = time_diff_seconds(target_time, first_timestamp)
-
-        # Estimate frame difference based on FPS
-        estimated_frame_diff = int(time_diff * fps)
-
-        # Calculate estimated frame number
-        estimated_frame = first_frame + estimated_frame_diff
+        if callback:
+            callback(0, f"Using timestamp {first_timestamp} at frame {first_frame} to estimate target frame")
 
-        # Ensure estimated frame is within valid range
-        estimated_frame = max(0, min(estimated_frame, total_frames - 1))
+        # Jump to estimated frames until the target is bracketed, then binary search
+        found_frame, estimated_frame = refine_frame_estimate(
+            cap, target_time, first_frame, first_timestamp, cache, ocr_config, region_coords,
+            callback, max(30, min(60, max_search_time * 0.2)), frame_rate)
+        if found_frame is not None:
+            return found_frame
 
         if callback:
-            callback(0, f"Using first timestamp at frame {first_frame} to estimate target frame")
-            callback(0, f"Time difference: {time_diff:.2f} seconds, estimated frame: {estimated_frame}")
+            callback(0, f"Could not narrow down the target frame, sampling from frame {estimated_frame}")
 
         # Start search from estimated frame
         frame_num = estimated_frame
@@ -321,9 +1147,9 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
         # Set a smaller initial sampling interval for more precise search
         adaptive_sampling = max(1, min(frame_sampling, 5))
     else:
-        # No first timestamp provided, start from beginning with default sampling
-        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-        frame_num = 0
+        # No first timestamp provided, start from start_at with default sampling.
+        # ocr_frames() moves the capture there, grabbing forward if it is already close.
+        frame_num = start_at
 
         # Start with a larger sampling interval for efficiency
         adaptive_sampling = min(frame_sampling * 3, 30)  # Start with larger interval but cap at 30
@@ -341,17 +1167,10 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
     progress_report_interval = max(1, total_frames // 100)  # Report progress every 1% of frames
 
     # For timeout tracking
-    start_time = datetime.now()
+    search_start = time.monotonic()
     timeout_warning_shown = False
 
     while frame_num < total_frames:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-        ret, frame = cap.read()
-        if not ret:
-            if callback:
-                callback(0, f"Error reading frame {frame_num}")
-            break
-
         # Update progress reporting
         frames_checked += 1
         if callback and (frames_checked - last_progress_report) >= progress_report_interval:
@@ -360,7 +1179,7 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
             last_progress_report = frames_checked
 
         # Check for timeout
-        elapsed_time = (datetime.now() - start_time).total_seconds()
+        elapsed_time = time.monotonic() - search_start
         if elapsed_time > max_search_time:
             if callback:
                 callback(0, f"Search timed out after {elapsed_time:.1f} seconds")
@@ -393,27 +1212,16 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
                     callback(0, f"Getting closer to target time ({time_diff/60:.1f} minutes). Adjusting sampling interval to {new_sampling}")
                 adaptive_sampling = new_sampling
 
-        # Check if this frame is already in cache
-        if frame_num in cache:
-            ts = cache[frame_num]
-        else:
-            overlay = frame[y_start:y_start+region_height, x_start:x_start+region_width]
-            gray = cv2.cvtColor(overlay, cv2.COLOR_BGR2GRAY)
-            try:
-                text = pytesseract.image_to_string(gray, config='--psm 7')
-                ts = parse_timestamp(text, ocr_config.patterns)
-                cache[frame_num] = ts
-            except Exception as e:
-                error_msg = str(e)
-                if "tesseract is not installed" in error_msg.lower() or "tesseract not found" in error_msg.lower():
-                    raise RuntimeError(
-                        "Tesseract OCR is not installed or not in your PATH. "
-                        "Please install Tesseract OCR and make sure it's in your system PATH. "
-                        "See the README.md file for more information."
-                    )
-                # For other OCR errors, continue with no timestamp
-                ts = None
-                cache[frame_num] = None
+        # Read this frame, together with the next few sampled frames so that
+        # they can be recognized in parallel, unless it is already in the cache
+        if frame_num not in cache:
+            lookahead = range(frame_num, min(total_frames, frame_num + adaptive_sampling * OCR_WORKERS), adaptive_sampling)
+            ocr_frames(cap, lookahead, region_coords, ocr_config.patterns, cache, ocr_config.grayscale_mode)
+        if frame_num not in cache:
+            if callback:
+                callback(0, f"Error reading frame {frame_num}")
+            break
+        ts = cache[frame_num]
 
         if ts:
             consecutive_failures = 0  # Reset failure counter on success
@@ -428,7 +1236,7 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
                     if callback:
                         callback(0, f"Found timestamp range containing target. Performing binary search between frames {last_valid_frame} and {frame_num}")
                     # Use 20% of the remaining time for binary search
-                    remaining_time = max_search_time - (datetime.now() - start_time).total_seconds()
+                    remaining_time = max_search_time - (time.monotonic() - search_start)
                     binary_search_timeout = max(30, min(60, remaining_time * 0.2))
                     return binary_search_frames(cap, last_valid_frame, frame_num, target_time, cache, ocr_config, callback, binary_search_timeout)
                 if callback:
@@ -465,6 +1273,11 @@ def find_frame_for_time(cap, target_time, frame_sampling=10, cache=None, ocr_con
 def binary_search_frames(cap, start_frame, end_frame, target_time, cache, ocr_config=None, callback=None, max_search_time=60):
     """Binary search between two frames to find the closest match to target time.
 
+    When the middle frame has no readable timestamp, the nearest readable frame
+    within a second of it is used instead (see read_nearest_timestamp()), so a
+    bound only moves past frames whose position relative to the target is known.
+    Only if none is readable, the search continues above the middle frame.
+
     Args:
         cap: Video capture object
         start_frame: Starting frame number
@@ -484,11 +1297,13 @@ def binary_search_frames(cap, start_frame, end_frame, target_time, cache, ocr_co
     if ocr_config is None:
         ocr_config = OCRConfig()
 
+    # Frames on each side of an unreadable middle frame searched for a timestamp
+    nearby_frames = max(1, round(cap.get(cv2.CAP_PROP_FPS)))
     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
     # Get region coordinates based on configuration
-    x_start, y_start, region_width, region_height = ocr_config.get_region_coords(width, height)
+    region_coords = ocr_config.get_region_coords(width, height)
 
     if callback:
         callback(0, f"Starting binary search between frames {start_frame} and {end_frame}")
@@ -498,7 +1313,7 @@ def binary_search_frames(cap, start_frame, end_frame, target_time, cache, ocr_co
     current_iteration = 0
 
     # For timeout tracking
-    start_time = datetime.now()
+    search_start = time.monotonic()
     timeout_warning_shown = False
 
     while start_frame <= end_frame:
@@ -511,7 +1326,7 @@ def binary_search_frames(cap, start_frame, end_frame, target_time, cache, ocr_co
             callback(progress_percent, f"Binary search iteration {current_iteration}/{total_iterations}: checking frame {mid_frame}")
 
         # Check for timeout
-        elapsed_time = (datetime.now() - start_time).total_seconds()
+        elapsed_time = time.monotonic() - search_start
         if elapsed_time > max_search_time:
             if callback:
                 callback(0, f"Binary search timed out after {elapsed_time:.1f} seconds")
@@ -527,41 +1342,25 @@ def binary_search_frames(cap, start_frame, end_frame, target_time, cache, ocr_co
                 callback(0, f"Binary search taking longer than expected ({elapsed_time:.1f} seconds). Will timeout in {max_search_time - elapsed_time:.1f} seconds")
             timeout_warning_shown = True
 
-        cap.set(cv2.CAP_PROP_POS_FRAMES, mid_frame)
-        ret, frame = cap.read()
-        if not ret:
-            if callback:
-                callback(0, f"Error reading frame {mid_frame}")
-            return start_frame
-
-        # Check if this frame is already in cache
-        if mid_frame in cache:
-            ts = cache[mid_frame]
-        else:
-            overlay = frame[y_start:y_start+region_height, x_start:x_start+region_width]
-            gray = cv2.cvtColor(overlay, cv2.COLOR_BGR2GRAY)
-            try:
-                text = pytesseract.image_to_string(gray, config='--psm 7')
-                ts = parse_timestamp(text, ocr_config.patterns)
-                cache[mid_frame] = ts
-            except Exception as e:
-                error_msg = str(e)
-                if "tesseract is not installed" in error_msg.lower() or "tesseract not found" in error_msg.lower():
-                    raise RuntimeError(
-                        "Tesseract OCR is not installed or not in your PATH. "
-                        "Please install Tesseract OCR and make sure it's in your system PATH. "
-                        "See the README.md file for more information."
-                    )
-                # For other OCR errors, continue with no timestamp
-                ts = None
-                cache[mid_frame] = None
-
-        if not ts:
-            # If no timestamp found, try the next frame
+        # Read the timestamp at the middle frame, or at the nearest frame within
+        # a second of it with a readable one. Unreadable frames say nothing about
+        # which half holds the target.
+        read_frame, ts = read_nearest_timestamp(cap, mid_frame, start_frame, end_frame, cache, ocr_config,
+                                                region_coords, nearby_frames, search_start + max_search_time)
+        if read_frame is None:
             if callback:
-                callback(0, f"No timestamp found at frame {mid_frame}")
+                callback(0, f"No timestamp found near frame {mid_frame}")
+            if (start_frame >= mid_frame - nearby_frames and end_frame <= mid_frame + nearby_frames
+                    and time.monotonic() - search_start <= max_search_time):
+                # No frame left in the range has a readable timestamp
+                break
+            # Nothing readable nearby; try the next frame
             start_frame = mid_frame + 1
             continue
+        if read_frame != mid_frame:
+            if callback:
+                callback(0, f"No timestamp found at frame {mid_frame}, using frame {read_frame}")
+            mid_frame = read_frame
 
         if callback:
             callback(0, f"Found timestamp {ts} at frame {mid_frame}")
@@ -588,19 +1387,88 @@ def binary_search_frames(cap, start_frame, end_frame, target_time, cache, ocr_co
     return start_frame
 
 
+def exponential_search_frames(cap, start_frame, target_time, cache, ocr_config=None, callback=None, max_search_time=60):
+    """Find the first frame at or after the target time, searching forward from a frame.
+
+    Timestamps only increase through the video, so frames are probed at
+    doubling distances after start_frame (one second, two seconds, four...)
+    until one shows the target time or later, and the last step is binary
+    searched. This reads O(log N) frames instead of sampling the whole range.
+    A probe without a readable timestamp is replaced by the nearest readable
+    frame within a second of it. If there is none, the next step is still
+    taken from the last frame known to be before the target, so the
+    unreadable frames stay inside the range that is binary searched.
+
+    Args:
+        cap: Video capture object
+        start_frame: Frame to search forward from
+        target_time: Target timestamp to find
+        cache: Dictionary to cache OCR results
+        ocr_config: OCR configuration (default: None, uses default config)
+        callback: Optional callback function for progress updates
+        max_search_time: Maximum search time in seconds for the binary search (default: 60)
+
+    Returns:
+        Frame number, or None if no frame at or after the target time was found
+
+    Raises:
+        RuntimeError: If Tesseract OCR is not installed or not in PATH or if search times out
+    """
+    if ocr_config is None:
+        ocr_config = OCRConfig()
+
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    # Get region coordinates based on configuration
+    region_coords = ocr_config.get_region_coords(width, height)
+
+    before_frame = start_frame
+    last_frame = total_frames - 1
+    step = max(1, round(fps))
+    while before_frame < last_frame:
+        probe = min(before_frame + step, last_frame)
+        if callback:
+            progress = 10 + int(40 * (probe - start_frame) / max(1, total_frames - start_frame))
+            callback(progress, f"Searching for end time at frame {probe}...")
+
+        # Read the probe, or the nearest readable frame after before_frame within
+        # a second of it, in a few ascending reads
+        frame_num, ts = read_nearest_timestamp(cap, probe, before_frame + 1, last_frame, cache, ocr_config, region_coords, max(1, round(fps)))
+
+        # Compare timestamps by time only, ignoring date
+        if ts is not None and is_time_gte(ts, target_time):
+            if callback:
+                callback(0, f"Target time is between frames {before_frame} and {frame_num}. Performing binary search")
+            return binary_search_frames(cap, before_frame, frame_num, target_time, cache, ocr_config, callback, max_search_time)
+
+        if ts is not None:
+            before_frame = frame_num
+        elif callback:
+            callback(0, f"No timestamp found near frame {probe}")
+        if probe == last_frame:
+            break
+        step *= 2
+
+    return None
+
+
 def extract_snippet(video_path, start_time, end_time, output_path, callback=None, ocr_config=None):
     """Extract a video snippet between start_time and end_time.
 
     This function uses an optimized search algorithm to find the frames corresponding to the
     start and end timestamps. The optimization works as follows:
 
-    1. First, it reads a frame from an early position in the video (10% of the way through)
-       to get an initial timestamp reading.
-    2. It uses this initial timestamp and the video's FPS to estimate where the start timestamp
-       might be located, allowing it to start searching from a position close to the target.
+    1. First, it reads the timestamps of the first and last frames. The frame rate of the
+       timestamps between them (which can differ from the video's nominal FPS) is used for
+       all estimates below.
+    2. It interpolates between the first and last timestamps to estimate where the start
+       timestamp is located, allowing it to start searching from a position close to the target.
     3. After finding the start frame, it reads the actual timestamp at that position.
     4. For the end timestamp search, it uses the start frame timestamp as a reference point
-       and the video's FPS to estimate where the end timestamp might be located.
+       to estimate where the end timestamp might be located.
     5. This allows the function to jump directly to frames close to the target timestamps,
        significantly reducing the search time.
     6. If the optimized search fails, it falls back to the traditional search method.
@@ -618,7 +1486,7 @@ def extract_snippet(video_path, start_time, end_time, output_path, callback=None
     """
     if ocr_config is None:
         ocr_config = OCRConfig()
-    cap = cv2.VideoCapture(video_path)
+    cap = open_video_capture(video_path)
     if not cap.isOpened():
         raise RuntimeError(
             "Unable to open video file. Please check that:\n"
@@ -637,44 +1505,40 @@ def extract_snippet(video_path, start_time, end_time, output_path, callback=None
 
     # Update callback with initial status
     if callback:
-        callback(0, "Reading initial frame to optimize search...")
+        callback(0, "Reading first and last frames to optimize search...")
 
-    # Get an initial timestamp reading from an early frame in the video
-    initial_frame_position = int(total_frames * 0.1)  # 10% of the way through the video
+    # Get region coordinates based on configuration
+    region_coords = ocr_config.get_region_coords(width, height)
+
+    # Read the timestamps at both ends of the video
     initial_timestamp = None
     initial_frame_num = None
-
-    # Try to get an initial timestamp reading
+    timestamp_rate = None
+    last_frame = total_frames - 1
     try:
-        # Set position and read frame
-        cap.set(cv2.CAP_PROP_POS_FRAMES, initial_frame_position)
-        ret, frame = cap.read()
-        if ret:
-            # Get region coordinates based on configuration
-            x_start, y_start, region_width, region_height = ocr_config.get_region_coords(width, height)
-
-            # Extract region for OCR
-            region = frame[y_start:y_start+region_height, x_start:x_start+region_width]
+        ocr_frames(cap, [0, last_frame], region_coords, ocr_config.patterns, ocr_cache, ocr_config.grayscale_mode)
+        first_ts = ocr_cache.get(0)
+        last_ts = ocr_cache.get(last_frame)
 
-            # Perform OCR
-            gray = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY)
-            text = pytesseract.image_to_string(gray, config='--psm 7')
-            initial_timestamp = parse_timestamp(text, ocr_config.patterns)
+        if first_ts:
+            initial_timestamp = first_ts
+            initial_frame_num = 0
+            if callback:
+                callback(0, f"Found initial timestamp {first_ts} at frame 0")
+        elif callback:
+            callback(0, "No timestamp found in first frame, falling back to traditional search")
 
-            if initial_timestamp:
-                initial_frame_num = initial_frame_position
-                ocr_cache[initial_frame_num] = initial_timestamp
-                if callback:
-                    callback(0, f"Found initial timestamp {initial_timestamp} at frame {initial_frame_num}")
-            else:
-                if callback:
-                    callback(0, "No timestamp found in initial frame, falling back to traditional search")
-        else:
+        # Measure how many frames there are per second of timestamp time
+        if first_ts and last_ts and is_time_gt(last_ts, first_ts) and last_frame > 0:
+            timestamp_rate = last_frame / time_diff_seconds(last_ts, first_ts)
             if callback:
-                callback(0, "Failed to read initial frame, falling back to traditional search")
+                callback(0, f"Found timestamp {last_ts} at frame {last_frame}, "
+                            f"{timestamp_rate:.2f} frames per second of timestamp time")
+    except ExtractionCancelled:
+        raise
     except Exception as e:
         if callback:
-            callback(0, f"Error reading initial frame: {str(e)}, falling back to traditional search")
+            callback(0, f"Error reading first and last frames: {str(e)}, falling back to traditional search")
 
     # Update callback
     if callback:
@@ -690,7 +1554,8 @@ def extract_snippet(video_path, start_time, end_time, output_path, callback=None
             ocr_config=ocr_config, 
             callback=callback,
             first_timestamp=initial_timestamp,
-            first_frame=initial_frame_num
+            first_frame=initial_frame_num,
+            frame_rate=timestamp_rate
         )
         if start_frame is None:
             raise RuntimeError(
@@ -713,29 +1578,11 @@ def extract_snippet(video_path, start_time, end_time, output_path, callback=None
         callback(10, "Start time found. Searching for end time...")
 
     # Get the timestamp at the start frame to use as reference
-    cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-    ret, frame = cap.read()
-    if not ret:
+    if not ocr_frames(cap, [start_frame], region_coords, ocr_config.patterns, ocr_cache, ocr_config.grayscale_mode):
         raise RuntimeError("Error reading start frame")
-
-    # Get region coordinates based on configuration
-    x_start, y_start, region_width, region_height = ocr_config.get_region_coords(width, height)
-
-    # Get the timestamp at the start frame
-    start_frame_ts = None
-    if start_frame in ocr_cache:
-        start_frame_ts = ocr_cache[start_frame]
-    else:
-        overlay = frame[y_start:y_start+region_height, x_start:x_start+region_width]
-        gray = cv2.cvtColor(overlay, cv2.COLOR_BGR2GRAY)
-        try:
-            text = pytesseract.image_to_string(gray, config='--psm 7')
-            start_frame_ts = parse_timestamp(text, ocr_config.patterns)
-            ocr_cache[start_frame] = start_frame_ts
-        except Exception as e:
-            # If there's an error, just continue without a reference timestamp
-            if callback:
-                callback(0, "Error reading timestamp at start frame, continuing without optimization")
+    start_frame_ts = ocr_cache[start_frame]
+    if start_frame_ts is None and callback:
+        callback(0, "Error reading timestamp at start frame, continuing without optimization")
 
     # Find end frame with sampling and caching, using start frame as reference if possible
     if start_frame_ts is not None and callback:
@@ -751,58 +1598,16 @@ def extract_snippet(video_path, start_time, end_time, output_path, callback=None
             ocr_config=ocr_config, 
             callback=callback,
             first_timestamp=start_frame_ts,
-            first_frame=start_frame
+            first_frame=start_frame,
+            frame_rate=timestamp_rate,
+            start_at=start_frame
         )
 
         if end_frame is None:
-            # If optimized search fails, fall back to traditional search
+            # If optimized search fails, search forward from the start frame
             if callback:
-                callback(0, "Optimized search failed to find end time, falling back to traditional search")
-
-            # Traditional search method
-            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-            end_frame = None
-            frame_sampling = 15
-            current_frame = start_frame
-
-            while current_frame < total_frames:
-                if callback:
-                    progress = 10 + int(40 * (current_frame - start_frame) / (total_frames - start_frame))
-                    callback(progress, "Searching for end time...")
-
-                cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame)
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                # Check if this frame is already in cache
-                if current_frame in ocr_cache:
-                    ts = ocr_cache[current_frame]
-                else:
-                    overlay = frame[y_start:y_start+region_height, x_start:x_start+region_width]
-                    gray = cv2.cvtColor(overlay, cv2.COLOR_BGR2GRAY)
-                    try:
-                        text = pytesseract.image_to_string(gray, config='--psm 7')
-                        ts = parse_timestamp(text, ocr_config.patterns)
-                        ocr_cache[current_frame] = ts
-                    except Exception as e:
-                        error_msg = str(e)
-                        if "tesseract is not installed" in error_msg.lower() or "tesseract not found" in error_msg.lower():
-                            raise RuntimeError(
-                                "Tesseract OCR is not installed or not in your PATH. "
-                                "Please install Tesseract OCR and make sure it's in your system PATH. "
-                                "See the README.md file for more information."
-                            )
-                        # For other OCR errors, continue with no timestamp
-                        ts = None
-                        ocr_cache[current_frame] = None
-
-                # Compare timestamps by time only, ignoring date
-                if ts and is_time_gte(ts, end_time):
-                    end_frame = current_frame
-                    break
-
-                current_frame += frame_sampling
+                callback(0, "Optimized search failed to find end time, falling back to exponential search")
+            end_frame = exponential_search_frames(cap, start_frame, end_time, ocr_cache, ocr_config, callback)
     except RuntimeError as e:
         # Re-raise the error with the original message
         if "timed out" in str(e).lower():
@@ -820,60 +1625,49 @@ def extract_snippet(video_path, start_time, end_time, output_path, callback=None
         if callback:
             callback(50, "End time found. Extracting frames...")
 
-    # Process frames in chunks to limit memory usage
-    max_frames_in_memory = 100  # Maximum number of frames to keep in memory at once
-
     if callback:
         callback(50, "Preparing for extraction...")
 
+    # Stream-copy the segment when FFmpeg is available; re-encode otherwise
+    if copy_video_segment(video_path, output_path, start_frame, end_frame, fps):
+        cap.release()
+        if callback:
+            callback(100, "Done!")
+        return
+
     # Create output video writer
-    fourcc = cv2.VideoWriter_fourcc(*'XVID')
-    out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+    out = open_video_writer(output_path, fps, (width, height))
+    if out is None:
+        cap.release()
+        raise RuntimeError(
+            "Unable to create the output video file. Please check that:\n"
+            "1. The output folder exists and is writable\n"
+            "2. You have the necessary codecs installed"
+        )
 
-    # Process all frames between start and end (or until end of video if end_frame is None)
-    cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+    # Process all frames between start and end (or until end of video if end_frame is None).
+    # grab_frame() steps forward to the start frame instead of seeking when it is close.
+    ret = grab_frame(cap, start_frame)
     frames_processed = 0
-    total_frames_estimate = end_frame - start_frame if end_frame is not None else total_frames - start_frame
-
-    # Process in chunks to limit memory usage
-    while True:
-        # Determine chunk size
-        chunk_size = max_frames_in_memory
-        chunk_frames = []
-
-        # Read chunk of frames
-        for i in range(chunk_size):
-            if callback and (frames_processed + i) % 30 == 0:
-                progress = 50 + int(40 * min(frames_processed + i, total_frames_estimate) / total_frames_estimate)
-                callback(progress, f"Extracting frames... ({frames_processed + i})")
-
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            # If we have an end frame and we've reached it, stop
-            if end_frame is not None and start_frame + frames_processed + i >= end_frame:
-                break
-
-            chunk_frames.append(frame)
-
-        # If no frames were read, we're done
-        if not chunk_frames:
+    total_frames_estimate = max(1, end_frame - start_frame if end_frame is not None else total_frames - start_frame)
+
+    # Decode and write one frame at a time so only a single frame is held in memory
+    last_progress = None
+    while ret and (end_frame is None or start_frame + frames_processed < end_frame):
+        # Only report when the progress value changes
+        if callback and frames_processed % 30 == 0:
+            progress = 50 + int(50 * min(frames_processed, total_frames_estimate) / total_frames_estimate)
+            if progress != last_progress:
+                last_progress = progress
+                callback(progress, f"Extracting frames... ({frames_processed})")
+
+        ret, frame = cap.retrieve()
+        if not ret:
             break
 
-        # Write chunk to output
-        for i, fr in enumerate(chunk_frames):
-            if callback and i % 30 == 0:
-                progress = 90 + int(10 * min(frames_processed + i, total_frames_estimate) / total_frames_estimate)
-                callback(progress, f"Writing output... ({frames_processed + i})")
-            out.write(fr)
-
-        frames_processed += len(chunk_frames)
-        chunk_frames = []  # Clear memory
-
-        # If we have an end frame and we've processed all frames up to it, we're done
-        if end_frame is not None and start_frame + frames_processed >= end_frame:
-            break
+        out.write(frame)
+        frames_processed += 1
+        ret = cap.grab()
 
     # If no frames were processed, raise an error
     if frames_processed == 0:
@@ -893,9 +1687,68 @@ def extract_snippet(video_path, start_time, end_time, output_path, callback=None
         callback(100, "Done!")
 
 
+class ExtractionCancelled(Exception):
+    """Raised from the progress callback to stop a running extraction."""
+
+
+class ExtractionWorker(QtCore.QObject):
+    """Run extract_snippet on a QThread and report back through signals."""
+
+    progress = QtCore.pyqtSignal(int, str)
+    succeeded = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+    cancelled = QtCore.pyqtSignal()
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, video_path, start_time, end_time, output_path, ocr_config):
+        super().__init__()
+        self.video_path = video_path
+        self.start_time = start_time
+        self.end_time = end_time
+        self.output_path = output_path
+        self.ocr_config = ocr_config
+        self._stop_requested = threading.Event()
+
+    def stop(self):
+        """Ask the extraction to stop at its next progress update.
+
+        Safe to call from any thread.
+        """
+        self._stop_requested.set()
+
+    def _report_progress(self, progress, status_text):
+        """Progress callback for extract_snippet that also checks for cancellation.
+
+        Args:
+            progress: Progress value (0-100)
+            status_text: Status text to display
+
+        Raises:
+            ExtractionCancelled: If stop() has been called
+        """
+        if self._stop_requested.is_set():
+            raise ExtractionCancelled()
+        self.progress.emit(progress, status_text)
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """Run the extraction."""
+        try:
+            extract_snippet(self.video_path, self.start_time, self.end_time, self.output_path,
+                            self._report_progress, self.ocr_config)
+            self.succeeded.emit(self.output_path)
+        except ExtractionCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.finished.emit()
+
+
 class MainWindow(QMainWindow):
     # Define signals
     stop_pulse_signal = QtCore.pyqtSignal()
+    progress_signal = QtCore.pyqtSignal(int, str)
 
     def __init__(self):
         super().__init__()
@@ -908,9 +1761,13 @@ class MainWindow(QMainWindow):
         self.ocr_config = OCRConfig()
         self.preview_dialog = None
         self.progress_timer = None
+        self.extraction_thread = None
+        self.extraction_worker = None
+        self._pulse_stopped = True
 
         # Connect signals to slots
         self.stop_pulse_signal.connect(self._stop_progress_pulse_slot)
+        self.progress_signal.connect(self._update_progress_main_thread)
         self.ui.selectFileButton.clicked.connect(self.select_file)
         self.ui.extractButton.clicked.connect(self.on_extract)
         self.ui.actionOpen.triggered.connect(self.select_file)
@@ -929,6 +1786,15 @@ class MainWindow(QMainWindow):
             layout.insertWidget(layout.indexOf(self.ui.extractButton), self.ui.previewButton)
             self.ui.previewButton.clicked.connect(self.on_preview)
 
+        # Add a cancel button after the extract button, enabled while extracting
+        self.ui.cancelButton = QtWidgets.QPushButton("Cancel")
+        self.ui.cancelButton.setMinimumSize(QtCore.QSize(100, 30))
+        self.ui.cancelButton.setStyleSheet("background-color: #333333; border-radius: 4px;")
+        self.ui.cancelButton.setEnabled(False)
+        layout = self.ui.extractButton.parent().layout()
+        layout.insertWidget(layout.indexOf(self.ui.extractButton) + 1, self.ui.cancelButton)
+        self.ui.cancelButton.clicked.connect(self.on_cancel)
+
         # Set initial UI state
         self.ui.progressBar.setValue(0)
         self.ui.statusLabel.setText("Ready")
@@ -957,25 +1823,20 @@ class MainWindow(QMainWindow):
     def update_progress(self, progress, status_text):
         """Update the progress bar and status label.
 
+        Safe to call from any thread; the update is delivered to the main thread
+        through progress_signal.
+
         Args:
             progress: Progress value (0-100)
             status_text: Status text to display
         """
-        # Stop pulsing if we're getting actual progress updates
-        # Use signal to stop the timer in the main thread
-        self.stop_pulse_signal.emit()
+        # Stop pulsing once actual progress updates arrive
+        # Use signal to stop the timer in the main thread, but only emit it once
+        if not self._pulse_stopped:
+            self._pulse_stopped = True
+            self.stop_pulse_signal.emit()
 
-        # Update UI in the main thread using invokeMethod if called from another thread
-        if QtCore.QThread.currentThread() != self.thread():
-            QtCore.QMetaObject.invokeMethod(
-                self,
-                "_update_progress_main_thread",
-                QtCore.Qt.ConnectionType.QueuedConnection,
-                QtCore.Q_ARG(int, progress),
-                QtCore.Q_ARG(str, status_text)
-            )
-        else:
-            self._update_progress_main_thread(progress, status_text)
+        self.progress_signal.emit(progress, status_text)
 
     @QtCore.pyqtSlot(int, str)
     def _update_progress_main_thread(self, progress, status_text):
@@ -989,9 +1850,7 @@ class MainWindow(QMainWindow):
         self.ui.statusLabel.setText(status_text)
 
         # Log the status message to the text area
-        self.log_status(status_text)
-
-        QApplication.processEvents()  # Force update of the UI
+        self._log_status_main_thread(status_text)
 
     def log_status(self, message):
         """Append a status message to the status text edit with timestamp.
@@ -1031,9 +1890,6 @@ class MainWindow(QMainWindow):
             self.ui.statusTextEdit.verticalScrollBar().maximum()
         )
 
-        # Force update of the UI
-        QApplication.processEvents()
-
     def clear_status_log(self):
         """Clear the status text edit and add a separator for a new operation."""
         # Update UI in the main thread using invokeMethod if called from another thread
@@ -1056,6 +1912,7 @@ class MainWindow(QMainWindow):
     def start_progress_pulse(self):
         """Start a pulsing animation on the progress bar to indicate activity."""
         if self.progress_timer is None:
+            self._pulse_stopped = False
             self.progress_timer = QtCore.QTimer(self)
             self.progress_timer.timeout.connect(self._update_pulse)
             self.progress_pulse_value = 0
@@ -1076,7 +1933,6 @@ class MainWindow(QMainWindow):
                 self.progress_pulse_direction = 1
 
         self.ui.progressBar.setValue(self.progress_pulse_value)
-        QApplication.processEvents()  # Force update of the UI
 
     def stop_progress_pulse(self):
         """Stop the pulsing animation on the progress bar.
@@ -1113,23 +1969,9 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Error", "Start and end timestamps are required")
                 return
 
-            # Try to parse with multiple formats
-            start_ts = None
-            end_ts = None
-
             # Try each pattern in the OCR config
-            for pattern, format_str in self.ocr_config.patterns:
-                try:
-                    if not start_ts:
-                        start_ts = datetime.strptime(start_str, format_str)
-                    if not end_ts:
-                        end_ts = datetime.strptime(end_str, format_str)
-
-                    # If both timestamps are parsed, break
-                    if start_ts and end_ts:
-                        break
-                except ValueError:
-                    continue
+            start_ts = parse_timestamp_string(start_str, self.ocr_config.patterns)
+            end_ts = parse_timestamp_string(end_str, self.ocr_config.patterns)
 
             # If we couldn't parse the timestamps
             if not start_ts:
@@ -1228,45 +2070,54 @@ class MainWindow(QMainWindow):
         # Start progress bar pulsing animation
         self.start_progress_pulse()
 
-        # Run extraction in a separate thread to keep UI responsive
-        def extraction_thread():
-            try:
-                # Add buffer: subtract 1 minute from start time and add 1 minute to end time
-                from datetime import timedelta
-                buffered_start_ts = start_ts - timedelta(minutes=1)
-                buffered_end_ts = end_ts + timedelta(minutes=1)
+        # Add buffer: subtract 1 minute from start time and add 1 minute to end time
+        buffered_start_ts = start_ts - timedelta(minutes=1)
+        buffered_end_ts = end_ts + timedelta(minutes=1)
+
+        # Run extraction on a worker thread to keep UI responsive
+        self.extraction_thread = QtCore.QThread(self)
+        self.extraction_worker = ExtractionWorker(
+            self.video_path, buffered_start_ts, buffered_end_ts, output_path, self.ocr_config)
+        self.extraction_worker.moveToThread(self.extraction_thread)
+
+        self.extraction_thread.started.connect(self.extraction_worker.run)
+        self.extraction_worker.progress.connect(self.update_progress)
+        self.extraction_worker.succeeded.connect(self.show_success_message)
+        self.extraction_worker.failed.connect(self.show_error_message)
+        self.extraction_worker.cancelled.connect(self.show_cancelled_message)
+        self.extraction_worker.finished.connect(self.extraction_thread.quit)
+        self.extraction_thread.finished.connect(self._extraction_thread_finished)
+
+        self.ui.cancelButton.setEnabled(True)
+        self.extraction_thread.start()
+
+    def on_cancel(self):
+        """Handle the cancel button click event."""
+        if self.extraction_worker is not None:
+            self.ui.cancelButton.setEnabled(False)
+            self.ui.statusLabel.setText("Cancelling...")
+            self.extraction_worker.stop()
 
-                extract_snippet(self.video_path, buffered_start_ts, buffered_end_ts, output_path, self.update_progress, self.ocr_config)
-
-                # Show success message on the main thread
-                QtCore.QMetaObject.invokeMethod(
-                    self, 
-                    "show_success_message", 
-                    QtCore.Qt.ConnectionType.QueuedConnection,
-                    QtCore.Q_ARG(str, output_path)
-                )
-
-            except Exception as e:
-                # Show error message on the main thread
-                QtCore.QMetaObject.invokeMethod(
-                    self, 
-                    "show_error_message", 
-                    QtCore.Qt.ConnectionType.QueuedConnection,
-                    QtCore.Q_ARG(str, str(e))
-                )
+    @QtCore.pyqtSlot()
+    def _extraction_thread_finished(self):
+        """Clean up the worker thread and reset the UI once the extraction has ended."""
+        self.extraction_worker.deleteLater()
+        self.extraction_thread.deleteLater()
+        self.extraction_worker = None
+        self.extraction_thread = None
+        self.reset_ui()
 
-            finally:
-                # Re-enable UI elements on the main thread
-                QtCore.QMetaObject.invokeMethod(
-                    self, 
-                    "reset_ui", 
-                    QtCore.Qt.ConnectionType.QueuedConnection
-                )
+    def closeEvent(self, event):
+        """Stop a running extraction before the window closes.
 
-        # Start extraction thread
-        thread = threading.Thread(target=extraction_thread)
-        thread.daemon = True
-        thread.start()
+        Args:
+            event: Close event
+        """
+        if self.extraction_thread is not None:
+            self.extraction_worker.stop()
+            self.extraction_thread.quit()
+            self.extraction_thread.wait()
+        super().closeEvent(event)
 
     @QtCore.pyqtSlot(str)
     def show_success_message(self, output_path):
@@ -1282,6 +2133,13 @@ class MainWindow(QMainWindow):
         QtWidgets.QApplication.restoreOverrideCursor()
         QMessageBox.critical(self, "Error", error_message)
 
+    @QtCore.pyqtSlot()
+    def show_cancelled_message(self):
+        """Log that the extraction was cancelled."""
+        # Restore cursor
+        QtWidgets.QApplication.restoreOverrideCursor()
+        self.log_status("Extraction cancelled")
+
     def on_preview(self):
         """Handle preview button click event."""
         if not self.video_path:
@@ -1361,10 +2219,11 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", text)
             return
 
-        # Convert frame to QImage for display
-        height, width, channel = frame.shape
-        bytes_per_line = 3 * width
-        q_img = QtGui.QImage(frame.data, width, height, bytes_per_line, QtGui.QImage.Format.Format_RGB888).rgbSwapped()
+        # The frame is already scaled to the preview size; convert it to RGB and
+        # wrap the buffer in a QImage without another copy
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        q_img = QtGui.QImage(rgb.data, rgb.shape[1], rgb.shape[0], rgb.strides[0],
+                             QtGui.QImage.Format.Format_RGB888)
 
         # Create a dialog to display the preview
         preview_dialog = QtWidgets.QDialog(self)
@@ -1376,8 +2235,7 @@ class MainWindow(QMainWindow):
 
         # Add image label
         image_label = QtWidgets.QLabel()
-        image_label.setPixmap(QtGui.QPixmap.fromImage(q_img).scaled(
-            600, 400, QtCore.Qt.AspectRatioMode.KeepAspectRatio))
+        image_label.setPixmap(QtGui.QPixmap.fromImage(q_img))
         layout.addWidget(image_label)
 
         # Add timestamp info
@@ -1416,6 +2274,7 @@ class MainWindow(QMainWindow):
         self.processing = False
         self.ui.extractButton.setEnabled(True)
         self.ui.previewButton.setEnabled(True)
+        self.ui.cancelButton.setEnabled(False)
         self.ui.statusLabel.setText("Ready")
 
         # Stop progress bar pulsing animation
@@ -1439,7 +2298,8 @@ def preview_timestamp_detection(video_path, frame_position=None, ocr_config=None
         callback: Optional callback function for progress updates
 
     Returns:
-        Tuple of (frame, detected_timestamp, timestamp_text) or (None, None, error_message) on error
+        Tuple of (frame, detected_timestamp, timestamp_text) or (None, None, error_message) on error.
+        The frame is scaled to fit PREVIEW_SIZE, with the timestamp region outlined.
     """
     if ocr_config is None:
         ocr_config = OCRConfig()
@@ -1449,7 +2309,7 @@ def preview_timestamp_detection(video_path, frame_position=None, ocr_config=None
         if callback:
             callback(10, "Opening video file...")
 
-        cap = cv2.VideoCapture(video_path)
+        cap = open_video_capture(video_path)
         if not cap.isOpened():
             return None, None, "Unable to open video file"
 
@@ -1470,9 +2330,10 @@ def preview_timestamp_detection(video_path, frame_position=None, ocr_config=None
         if callback:
             callback(40, "Seeking to frame position...")
 
-        # Set position and read frame
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_position)
-        ret, frame = cap.read()
+        # Move to the frame and decode only that one
+        ret = grab_frame(cap, frame_position)
+        if ret:
+            ret, frame = cap.retrieve()
         if not ret:
             return None, None, "Failed to read frame from video"
 
@@ -1486,19 +2347,27 @@ def preview_timestamp_detection(video_path, frame_position=None, ocr_config=None
         # Get region coordinates
         x_start, y_start, region_width, region_height = ocr_config.get_region_coords(width, height)
 
-        # Extract region for OCR
+        # Extract region for OCR at full resolution
         region = frame[y_start:y_start+region_height, x_start:x_start+region_width]
-
-        # Draw rectangle around the region on the original frame
-        cv2.rectangle(frame, (x_start, y_start), (x_start+region_width, y_start+region_height), (0, 255, 0), 2)
+        gray = prepare_overlay(region, ocr_config.grayscale_mode)
+
+        # Only the preview-sized frame is kept for display. Scale it to fit
+        # PREVIEW_SIZE (keeping its aspect ratio) and draw a rectangle around
+        # the region in the scaled coordinates.
+        scale = min(PREVIEW_SIZE[0] / width, PREVIEW_SIZE[1] / height)
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        frame = cv2.resize(frame, (max(1, round(width * scale)), max(1, round(height * scale))),
+                           interpolation=interpolation)
+        cv2.rectangle(frame, (round(x_start * scale), round(y_start * scale)),
+                      (round((x_start + region_width) * scale), round((y_start + region_height) * scale)),
+                      (0, 255, 0), 2)
 
         # Update progress
         if callback:
             callback(80, "Performing OCR...")
 
-        # Perform OCR
-        gray = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY)
-        text = pytesseract.image_to_string(gray, config='--psm 7')
+        # Perform OCR, reusing the text if this region was recognized before
+        text = ocr_image_cached(gray)
         timestamp = parse_timestamp(text, ocr_config.patterns)
 
         cap.release()
@@ -1516,18 +2385,24 @@ def preview_timestamp_detection(video_path, frame_position=None, ocr_config=None
         return None, None, f"Error during preview: {str(e)}"
 
 
+@functools.lru_cache(maxsize=1)
 def find_tesseract_executable():
     """Find the Tesseract executable on the system.
 
+    The result is cached, so the version checks and the search of common
+    install locations only run once per session.
+
     Returns:
         Tuple of (success, path_or_error_message)
     """
-    # First check if it's already configured and working
-    try:
-        version = pytesseract.get_tesseract_version()
-        return True, f"Tesseract is properly configured (version {version})"
-    except Exception:
-        pass
+    # First check if it's already configured and working. Only start Tesseract
+    # if the configured command exists on the PATH or as a path.
+    if shutil.which(pytesseract.pytesseract.tesseract_cmd):
+        try:
+            version = pytesseract.get_tesseract_version()
+            return True, f"Tesseract is properly configured (version {version})"
+        except Exception:
+            pass
 
     # Try to find Tesseract in common locations
     possible_locations = []
@@ -1552,9 +2427,9 @@ def find_tesseract_executable():
             '/opt/homebrew/bin/tesseract',  # M1 Mac Homebrew
         ]
 
-    # Check each location
-    for location in possible_locations:
-        if os.path.isfile(location):
+    # Check each location, skipping duplicates and files that can't be run
+    for location in dict.fromkeys(possible_locations):
+        if os.path.isfile(location) and os.access(location, os.X_OK):
             try:
                 # Try to set and test this location
                 pytesseract.pytesseract.tesseract_cmd = location
@@ -1592,6 +2467,9 @@ if __name__ == "__main__":
     else:
         print(f"Tesseract status: {message}")
 
+    # Load the OCR model in the background while the window is set up
+    threading.Thread(target=warm_up_ocr, daemon=True).start()
+
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -4,9 +4,18 @@ Test script for batch_extract.py.
 This script tests the key components of the batch extraction functionality.
 """
 
+import os
+import tempfile
 import unittest
 from datetime import datetime
-from batch_extract import convert_rangetime_timestamp, RANGETIME_PATTERN
+from unittest import mock
+from batch_extract import (
+    convert_rangetime_timestamp,
+    extract_batch_segments,
+    find_rangetime_files,
+    process_rangetime_file,
+    RANGETIME_REGEX,
+)
 
 class TestBatchExtract(unittest.TestCase):
     """Test cases for batch extraction components."""
@@ -14,12 +23,12 @@ class TestBatchExtract(unittest.TestCase):
     def test_rangetime_pattern(self):
         """Test that the rangetime pattern correctly matches timestamps."""
         # Test valid timestamp
-        match = RANGETIME_PATTERN[0].search("20250613_132726.332")
+        match = RANGETIME_REGEX.search("20250613_132726.332")
         self.assertIsNotNone(match)
         self.assertEqual(match.group(1), "20250613_132726.332")
         
         # Test invalid timestamp
-        match = RANGETIME_PATTERN[0].search("invalid_timestamp")
+        match = RANGETIME_REGEX.search("invalid_timestamp")
         self.assertIsNone(match)
     
     def test_convert_rangetime_timestamp(self):
@@ -38,6 +47,12 @@ class TestBatchExtract(unittest.TestCase):
         # Test invalid timestamp
         ts = convert_rangetime_timestamp("invalid_timestamp")
         self.assertIsNone(ts)
+
+        # Test malformed and out-of-range timestamps
+        self.assertIsNone(convert_rangetime_timestamp("20250613-132726.332"))
+        self.assertIsNone(convert_rangetime_timestamp("2025061_132726.3321"))
+        self.assertIsNone(convert_rangetime_timestamp("20251313_132726.332"))
+        self.assertIsNone(convert_rangetime_timestamp("20250613_256000.000"))
     
     def test_timestamp_conversion(self):
         """Test that timestamps are correctly converted for use with extract_snippet."""
@@ -51,5 +66,82 @@ class TestBatchExtract(unittest.TestCase):
         ts_str = ts.strftime("%d/%m/%Y %H:%M:%S:%f")[:-3]  # Format as DD/MM/YYYY HH:mm:ss:SSS
         self.assertEqual(ts_str, "13/06/2025 13:27:26:332")
 
+    def test_extract_batch_segments(self):
+        """Test that every segment in every rangetime.txt file is extracted."""
+        with tempfile.TemporaryDirectory() as parent_dir:
+            for name, end in (("a", "132736.332"), ("b", "132746.332")):
+                os.makedirs(os.path.join(parent_dir, name))
+                with open(os.path.join(parent_dir, name, "rangetime.txt"), "w") as f:
+                    f.write("start,end\n")
+                    f.write(f"20250613_132726.332,20250613_{end}\n")
+
+            with mock.patch("batch_extract.extract_snippet") as extract_snippet:
+                processed = extract_batch_segments("video.mkv", parent_dir)
+
+            self.assertEqual(processed, 2)
+            self.assertEqual(extract_snippet.call_count, 2)
+            end_times = []
+            for call in extract_snippet.call_args_list:
+                video_path, start_time, end_time = call.args[:3]
+                self.assertEqual(video_path, "video.mkv")
+                self.assertEqual(start_time, datetime(2025, 6, 13, 13, 26, 26, 332000))
+                end_times.append(end_time)
+            self.assertEqual(sorted(end_times), [
+                datetime(2025, 6, 13, 13, 28, 36, 332000),
+                datetime(2025, 6, 13, 13, 28, 46, 332000),
+            ])
+
+    def test_process_rangetime_file_output_paths(self):
+        """Test that each range in a rangetime.txt file gets its own output file."""
+        with tempfile.TemporaryDirectory() as folder:
+            rangetime_path = os.path.join(folder, "rangetime.txt")
+            with open(rangetime_path, "w") as f:
+                f.write("first_timestamp,last_timestamp\n")
+                f.write("20250613_132726.332,20250613_132730.850\n")
+                f.write("20250613_140000.000,20250613_140010.000\n")
+
+            segments = process_rangetime_file(rangetime_path, "video.mkv")
+
+            self.assertEqual(
+                [output_path for _, _, output_path in segments],
+                [os.path.join(folder, "video.avi"), os.path.join(folder, "video_2.avi")],
+            )
+
+    def test_find_rangetime_files_cache(self):
+        """Test that cached discovery results pick up newly added files."""
+        with tempfile.TemporaryDirectory() as parent_dir:
+            first = os.path.join(parent_dir, "a", "rangetime.txt")
+            os.makedirs(os.path.dirname(first))
+            open(first, "w").close()
+            self.assertEqual(find_rangetime_files(parent_dir), [first])
+            self.assertEqual(find_rangetime_files(parent_dir), [first])
+
+            second = os.path.join(parent_dir, "b", "rangetime.txt")
+            os.makedirs(os.path.dirname(second))
+            open(second, "w").close()
+            self.assertEqual(sorted(find_rangetime_files(parent_dir)), sorted([first, second]))
+
+    def test_extract_batch_segments_duplicate_ranges(self):
+        """Test that identical ranges are extracted once and copied to the other folders."""
+        with tempfile.TemporaryDirectory() as parent_dir:
+            for name in ("a", "b"):
+                os.makedirs(os.path.join(parent_dir, name))
+                with open(os.path.join(parent_dir, name, "rangetime.txt"), "w") as f:
+                    f.write("start,end\n")
+                    f.write("20250613_132726.332,20250613_132736.332\n")
+
+            def fake_extract_snippet(video_path, start_time, end_time, output_path, *args):
+                with open(output_path, "w") as f:
+                    f.write("snippet")
+
+            with mock.patch("batch_extract.extract_snippet", side_effect=fake_extract_snippet) as extract_snippet:
+                processed = extract_batch_segments("video.mkv", parent_dir)
+
+            self.assertEqual(processed, 2)
+            self.assertEqual(extract_snippet.call_count, 1)
+            for name in ("a", "b"):
+                with open(os.path.join(parent_dir, name, "video.avi")) as f:
+                    self.assertEqual(f.read(), "snippet")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -5,16 +5,31 @@ This script tests the key components of VidExtract to ensure they work as expect
 """
 
 import os
+import random
 import sys
+import time
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
+from unittest import mock
+
+import cv2
+import numpy as np
 
 # Import components from main.py
 try:
     from main import (
         parse_timestamp,
         OCRConfig,
+        binary_search_frames,
+        exponential_search_frames,
+        extract_snippet,
+        ExtractionCancelled,
+        find_frame_for_time,
         find_tesseract_executable,
+        frames_until_time,
+        parse_fixed_width_timestamp,
+        parse_timestamp_string,
+        prepare_overlay,
         preview_timestamp_detection,
     )
 except ImportError:
@@ -22,6 +37,46 @@ except ImportError:
     sys.exit(1)
 
 
+class FakeCapture:
+    """Stand-in for cv2.VideoCapture whose frames carry known timestamps."""
+
+    def __init__(self, timestamps, fps=30.0):
+        # Timestamp shown by each frame, or None where the overlay is unreadable
+        self.timestamps = timestamps
+        self.fps = fps
+
+    def isOpened(self):
+        return True
+
+    def get(self, prop):
+        return {
+            cv2.CAP_PROP_FRAME_COUNT: len(self.timestamps),
+            cv2.CAP_PROP_FPS: self.fps,
+            cv2.CAP_PROP_FRAME_WIDTH: 640,
+            cv2.CAP_PROP_FRAME_HEIGHT: 360,
+        }[prop]
+
+
+def fake_ocr_frames(cap, frame_nums, region_coords, patterns, cache, grayscale_mode="green"):
+    """Replacement for ocr_frames that reads the timestamps of a FakeCapture."""
+    for frame_num in frame_nums:
+        cache.setdefault(frame_num, cap.timestamps[frame_num])
+    return True
+
+
+def make_timestamps(count, fps=30.0, unreadable_every=None, unreadable_share=0.0):
+    """Timestamps of a video starting at 12:00, with every Nth frame or a random
+    share of the frames (never the first or last) unreadable."""
+    start = datetime(2023, 2, 1, 12, 0, 0)
+    rng = random.Random(1)
+    timestamps = []
+    for i in range(count):
+        unreadable = (unreadable_every and i % unreadable_every == 3) or (
+            0 < i < count - 1 and rng.random() < unreadable_share)
+        timestamps.append(None if unreadable else start + timedelta(seconds=i / fps))
+    return timestamps
+
+
 class TestVidExtract(unittest.TestCase):
     """Test cases for VidExtract components."""
 
@@ -124,6 +179,205 @@ class TestVidExtract(unittest.TestCase):
         self.assertEqual(w, 400)
         self.assertEqual(h, 60)
 
+    def test_parse_fixed_width_timestamp(self):
+        """Test that the fixed-width parser agrees with strptime."""
+        samples = {
+            "%m/%d/%Y %H:%M:%S:%f": "02/01/2023 12:34:56:789",
+            "%d/%m/%Y %H:%M:%S:%f": "01/02/2023 12:34:56:789",
+            "%Y-%m-%d %H:%M:%S.%f": "2023-02-01 12:34:56.789",
+            "%H:%M:%S:%f": "12:34:56:789",
+            "%H:%M:%S.%f": "12:34:56.789",
+        }
+        for format_str, sample in samples.items():
+            self.assertEqual(parse_fixed_width_timestamp(sample, format_str),
+                             datetime.strptime(sample, format_str))
+
+        # Out-of-range fields are rejected like strptime does
+        with self.assertRaises(ValueError):
+            parse_fixed_width_timestamp("13/01/2023 12:34:56:789", "%m/%d/%Y %H:%M:%S:%f")
+
+        # Other formats are left to strptime
+        self.assertIsNone(parse_fixed_width_timestamp("12:34:56", "%H:%M:%S"))
+
+    def test_parse_timestamp_string(self):
+        """Test parsing of timestamps entered by the user."""
+        self.assertEqual(parse_timestamp_string("02/01/2023 12:34:56:789"),
+                         datetime(2023, 2, 1, 12, 34, 56, 789000))
+        # Day-first dates that aren't valid month-first dates use the next pattern
+        self.assertEqual(parse_timestamp_string("13/01/2023 12:34:56:789"),
+                         datetime(2023, 1, 13, 12, 34, 56, 789000))
+        self.assertEqual(parse_timestamp_string("2023-02-01 12:34:56.789"),
+                         datetime(2023, 2, 1, 12, 34, 56, 789000))
+        # Unpadded fields are still accepted through strptime
+        self.assertEqual(parse_timestamp_string("2/1/2023 12:34:56:789"),
+                         datetime(2023, 2, 1, 12, 34, 56, 789000))
+        self.assertIsNone(parse_timestamp_string("not a timestamp"))
+
+    def test_prepare_overlay(self):
+        """Test that the overlay is binarized to dark text on a light background."""
+        overlay = np.full((20, 40, 3), 30, dtype=np.uint8)
+        overlay[5:15, 5:15] = (255, 255, 255)
+        binary = prepare_overlay(overlay)
+        self.assertEqual(binary[10, 10], 0)
+        self.assertEqual(binary[2, 30], 255)
+
+        # Magenta text with the background's green level needs the luma conversion
+        overlay[5:15, 5:15] = (255, 30, 255)
+        self.assertEqual(prepare_overlay(overlay, OCRConfig.GRAYSCALE_GREEN)[10, 10], 255)
+        self.assertEqual(prepare_overlay(overlay, OCRConfig.GRAYSCALE_LUMA)[10, 10], 0)
+
+    def test_frames_until_time(self):
+        """Test the frame offset estimate used to jump toward a target time."""
+        ts = datetime(2023, 2, 1, 12, 0, 10)
+        self.assertEqual(frames_until_time(ts, datetime(2023, 2, 1, 12, 0, 20), 30), 300)
+        self.assertEqual(frames_until_time(ts, datetime(2023, 2, 1, 12, 0, 5), 30), -150)
+        # The date is ignored
+        self.assertEqual(frames_until_time(ts, datetime(2024, 5, 6, 12, 0, 10, 500000), 30), 15)
+
+    @mock.patch("main.ocr_frames", fake_ocr_frames)
+    def test_binary_search_frames(self):
+        """Test that binary search finds the first frame at or after the target time."""
+        start = datetime(2023, 2, 1, 12, 0, 0)
+        cap = FakeCapture(make_timestamps(30000))
+        for frame in (1, 4567, 13428, 29998):
+            target = start + timedelta(seconds=(frame - 0.5) / 30)
+            self.assertEqual(binary_search_frames(cap, 0, 29999, target, {}), frame)
+
+        # Unreadable middle frames must not push the search past the target. It may
+        # stop on unreadable frames just before the target, which can't be ruled out.
+        cap = FakeCapture(make_timestamps(30000, unreadable_every=5))
+        for frame in (1, 4567, 13428, 15469, 29998):
+            target = start + timedelta(seconds=(frame - 0.5) / 30)
+            found = binary_search_frames(cap, 0, 29999, target, {})
+            self.assertLessEqual(found, frame)
+            self.assertTrue(all(cap.timestamps[i] is None for i in range(found, frame)))
+
+    def test_binary_search_frames_unreadable_stretch(self):
+        """Test that a long unreadable stretch costs a bounded number of reads and respects the timeout."""
+        start = datetime(2023, 2, 1, 12, 0, 0)
+        cap = FakeCapture(make_timestamps(30000))
+        cap.timestamps[10000:20000] = [None] * 10000
+        calls = []
+
+        def counting_ocr_frames(cap, frame_nums, *args, **kwargs):
+            frame_nums = list(frame_nums)
+            self.assertEqual(frame_nums, sorted(frame_nums))
+            calls.append(frame_nums)
+            return fake_ocr_frames(cap, frame_nums, *args, **kwargs)
+
+        cache = {}
+        with mock.patch("main.ocr_frames", counting_ocr_frames):
+            target = start + timedelta(seconds=24999.5 / 30)
+            self.assertEqual(binary_search_frames(cap, 0, 29999, target, cache), 25000)
+        self.assertLess(len(cache), 200)
+        self.assertLess(len(calls), 50)
+
+        def slow_ocr_frames(cap, frame_nums, region_coords, patterns, cache, grayscale_mode="green"):
+            for frame_num in frame_nums:
+                if frame_num not in cache:
+                    time.sleep(0.005)
+            return fake_ocr_frames(cap, frame_nums, region_coords, patterns, cache, grayscale_mode)
+
+        cache = {}
+        cap = FakeCapture([None] * 30000)
+        with mock.patch("main.ocr_frames", slow_ocr_frames):
+            with self.assertRaises(RuntimeError):
+                binary_search_frames(cap, 0, 29999, target, cache, max_search_time=0.05)
+        # The scan around the middle frame stops at the deadline, before reading a second either side
+        self.assertLess(len(cache), 61)
+
+    @mock.patch("main.ocr_frames", fake_ocr_frames)
+    def test_find_frame_for_time_unreadable_frames(self):
+        """Test that frame estimates landing on unreadable frames still find the target."""
+        start = datetime(2023, 2, 1, 12, 0, 0)
+        cap = FakeCapture(make_timestamps(30000, unreadable_share=0.2))
+        for frame in random.Random(2).sample(range(100, 29900), 40):
+            target = start + timedelta(seconds=(frame - 0.5) / 30)
+            # The first and last frames are read up front, as extract_snippet does
+            cache = {0: cap.timestamps[0], 29999: cap.timestamps[29999]}
+            found = find_frame_for_time(cap, target, cache=cache, first_timestamp=start, first_frame=0)
+            self.assertLessEqual(found, frame)
+            self.assertTrue(all(cap.timestamps[i] is None for i in range(found, frame)))
+
+    @mock.patch("main.ocr_frames", fake_ocr_frames)
+    def test_exponential_search_frames(self):
+        """Test the forward search for an end time after a known start frame."""
+        start = datetime(2023, 2, 1, 12, 0, 0)
+        for unreadable_share in (0.0, 0.2):
+            cap = FakeCapture(make_timestamps(30000, unreadable_share=unreadable_share))
+            for frame in (1030, 1100, 4567, 13428, 29998):
+                target = start + timedelta(seconds=(frame - 0.5) / 30)
+                found = exponential_search_frames(cap, 1000, target, {})
+                self.assertLessEqual(found, frame)
+                self.assertTrue(all(cap.timestamps[i] is None for i in range(found, frame)))
+
+            # An end time after the last frame isn't found
+            self.assertIsNone(exponential_search_frames(cap, 1000, start + timedelta(hours=1), {}))
+
+        # A probe inside an unreadable stretch is read in a few ascending windows
+        cap = FakeCapture(make_timestamps(30000))
+        cap.timestamps[1430:1475] = [None] * 45
+        reading_calls = []
+
+        def counting_ocr_frames(cap, frame_nums, region_coords, patterns, cache, grayscale_mode="green"):
+            frame_nums = list(frame_nums)
+            self.assertEqual(frame_nums, sorted(frame_nums))
+            if any(frame_num not in cache for frame_num in frame_nums):
+                reading_calls.append(frame_nums)
+            return fake_ocr_frames(cap, frame_nums, region_coords, patterns, cache, grayscale_mode)
+
+        with mock.patch("main.ocr_frames", counting_ocr_frames):
+            found = exponential_search_frames(cap, 1000, start + timedelta(seconds=1459.5 / 30), {})
+        self.assertEqual(found, 1430)
+        self.assertLess(len(reading_calls), 20)
+
+        # An end time inside a long unreadable stretch can't be placed exactly, but
+        # the search must not end past the first readable frame after it
+        cap = FakeCapture(make_timestamps(30000))
+        cap.timestamps[1900:2500] = [None] * 600
+        found = exponential_search_frames(cap, 1000, start + timedelta(seconds=1999.5 / 30), {})
+        self.assertTrue(1900 <= found <= 2500)
+
+    def test_extract_snippet_cancelled(self):
+        """Test that a cancellation while reading the first and last frames isn't swallowed."""
+        calls = []
+
+        def cancelled_ocr_frames(*args, **kwargs):
+            # Cancelled during the first read; the search must not go on
+            calls.append(args)
+            if len(calls) > 1:
+                raise RuntimeError("read after cancellation")
+            raise ExtractionCancelled()
+
+        cap = FakeCapture(make_timestamps(300))
+        start = datetime(2023, 2, 1, 12, 0, 0)
+        with mock.patch("main.open_video_capture", return_value=cap), \
+                mock.patch("main.ocr_frames", cancelled_ocr_frames):
+            with self.assertRaises(ExtractionCancelled):
+                extract_snippet("video.avi", start, start + timedelta(seconds=5), "out.avi")
+
+    def test_find_frame_for_time_unreadable_estimate(self):
+        """Test that an estimate inside an unreadable stretch is read in a few ascending windows."""
+        start = datetime(2023, 2, 1, 12, 0, 0)
+        cap = FakeCapture(make_timestamps(30000))
+        cap.timestamps[13400:13445] = [None] * 45
+        reading_calls = []
+
+        def counting_ocr_frames(cap, frame_nums, region_coords, patterns, cache, grayscale_mode="green"):
+            frame_nums = list(frame_nums)
+            self.assertEqual(frame_nums, sorted(frame_nums))
+            if any(frame_num not in cache for frame_num in frame_nums):
+                reading_calls.append(frame_nums)
+            return fake_ocr_frames(cap, frame_nums, region_coords, patterns, cache, grayscale_mode)
+
+        cache = {0: cap.timestamps[0], 29999: cap.timestamps[29999]}
+        with mock.patch("main.ocr_frames", counting_ocr_frames):
+            target = start + timedelta(seconds=13427.5 / 30)
+            found = find_frame_for_time(cap, target, cache=cache, first_timestamp=start, first_frame=0)
+        # The target frame is unreadable, so the search stops at the start of the stretch
+        self.assertEqual(found, 13400)
+        self.assertLess(len(reading_calls), 20)
+
     def test_tesseract_detection(self):
         """Test the Tesseract detection function."""
         success, message = find_tesseract_executable()